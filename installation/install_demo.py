@@ -107,6 +107,7 @@ class EnhancedInstaller:
             "reportlab==4.4.3",
             "pillow==11.3.0",
             "pytesseract==0.3.13",
+            "numpy==1.26.4",
             "python-docx==1.2.0",
             "openpyxl==3.1.5",
             "pywin32==308"
@@ -14,14 +14,16 @@ src_dir = script_dir / "src"
 sys.path.insert(0, str(src_dir))
 
 # Import and run the main application
-try:
-    from main import main
-    print("Starting Garrett Discovery Document Prep Tool...")
-    main()
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Make sure you're running this from the project root directory")
-    print("Or install dependencies: pip install -r installation/requirements.txt")
-except Exception as e:
-    print(f"Error starting application: {e}")
-    sys.exit(1)
\ No newline at end of file
+# (guarded so OCR worker processes re-importing this module don't relaunch the GUI)
+if __name__ == "__main__":
+    try:
+        from main import main
+        print("Starting Garrett Discovery Document Prep Tool...")
+        main()
+    except ImportError as e:
+        print(f"Import error: {e}")
+        print("Make sure you're running this from the project root directory")
+        print("Or install dependencies: pip install -r installation/requirements.txt")
+    except Exception as e:
+        print(f"Error starting application: {e}")
+        sys.exit(1)
\ No newline at end of file
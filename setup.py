@@ -77,7 +77,7 @@ setup(
         "reportlab>=4.1.0",
         "pillow>=10.4.0",
         "pytesseract>=0.3.13",
-        "imutils>=0.5.4",
+        "numpy>=1.24.0",
         "python-docx>=1.1.2",
         "openpyxl>=3.1.3",
         "psutil>=5.9.8",
@@ -103,6 +103,10 @@ setup(
         ],
         "ocr": [
             "tesseract>=5.0.0",
+            "tesserocr>=2.6.0",
+        ],
+        "performance": [
+            "numba>=0.59.0",
         ],
     },
 
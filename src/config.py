@@ -27,4 +27,9 @@ BOTTOM_MARGIN_POINTS = 20  # Distance from bottom edge
 # Footer configuration - consistent styling for filename and Bates number
 FOOTER_FONT_NAME = "Times-Roman"
 FOOTER_FONT_SIZE = 9
-FOOTER_FONT_COLOR = (0, 0, 0)  # Black for both filename and Bates number
\ No newline at end of file
+FOOTER_FONT_COLOR = (0, 0, 0)  # Black for both filename and Bates number
+
+# PDF saving - orientation fixes only change each page's /Rotate entry, so by
+# default corrected PDFs are written without full garbage collection and
+# content stream cleanup; set True to always rewrite them fully optimized
+OPTIMIZE_ON_SAVE = False
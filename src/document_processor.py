@@ -200,6 +200,9 @@ class GDIDocumentProcessor:
                 if not self._process_by_type():
                     return False
 
+                # Let background line mapping writes land before logs and cleanup
+                self.pdf_converter.shutdown()
+
                 # Step 6: Create log files with calculated statistics
                 if not self.should_continue:
                     return False
@@ -228,6 +231,9 @@ class GDIDocumentProcessor:
             self.log(f"Fatal error during processing: {str(e)}")
             self.logger_manager.log_processing_error("", str(e), "main_processing")
             return False
+
+        finally:
+            self.pdf_converter.shutdown()
             
     def _scan_files(self):
         """Scan source folder for supported files"""
@@ -13,6 +13,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable, Union
 from functools import wraps
 from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
 
 
 class ValidationError(Exception):
@@ -30,6 +33,11 @@ class ProcessingError(Exception):
     pass
 
 
+class PoolUnavailableError(ResourceError):
+    """Raised when a process pool cannot be started or dies mid-run"""
+    pass
+
+
 class ErrorHandler:
     """Comprehensive error handling and validation utilities"""
 
@@ -467,4 +475,32 @@ def manage_resources(resource_cleanup_func: Callable = None):
                     error_handler.cleanup_temporary_files(temp_files)
 
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def map_in_process_pool(fn, *iterables, max_workers: int, chunksize: int = 1) -> list:
+    """
+    Map fn over iterables in a process pool, as Executor.map does
+
+    Only failures of the pool itself - starting it, submitting tasks to it or a
+    worker process dying - raise PoolUnavailableError, so callers can fall back
+    to sequential processing. Exceptions raised by fn propagate unchanged.
+
+    Returns:
+        list: Results in input order
+    """
+    try:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    except OSError as e:
+        raise PoolUnavailableError(str(e)) from e
+
+    with executor:
+        try:
+            # map() submits every task up front
+            results = executor.map(fn, *iterables, chunksize=chunksize)
+        except (BrokenProcessPool, OSError, PicklingError) as e:
+            raise PoolUnavailableError(str(e)) from e
+        try:
+            return list(results)
+        except BrokenProcessPool as e:
+            raise PoolUnavailableError(str(e)) from e
@@ -15,6 +15,7 @@ import sys
 import os
 import json
 import threading
+import multiprocessing
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -1008,6 +1009,9 @@ Tips:
 
 def main():
     """Main application entry point"""
+    # Required for OCR worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Modern look
 
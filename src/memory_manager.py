@@ -287,7 +287,7 @@ class MemoryManager:
 
                         # Periodic cleanup
                         if self.processed_files_count % self.config.cleanup_interval == 0:
-                            self.perform_periodic_cleanup()
+                            self.force_cleanup()
 
                     except Exception as e:
                         self.logger.error(f"Error processing file {file_info}: {e}")
@@ -305,10 +305,9 @@ class MemoryManager:
         self._log_memory_info(f"🎉 Batch processing completed. Total processed: {self.processed_files_count}")
 
     def perform_periodic_cleanup(self):
-        """Perform periodic cleanup operations"""
+        """Perform periodic cleanup operations (kept for backwards compatibility)"""
         try:
             if self.processed_files_count % self.config.cleanup_interval == 0:
-                self._log_memory_info(f"🧹 Periodic cleanup (every {self.config.cleanup_interval} files)")
                 self.force_cleanup()
 
         except Exception as e:
@@ -432,7 +431,7 @@ def memory_managed(operation_name: str = None):
 
                     # Periodic cleanup
                     if memory_manager.processed_files_count % memory_manager.config.cleanup_interval == 0:
-                        memory_manager.perform_periodic_cleanup()
+                        memory_manager.force_cleanup()
 
                     memory_manager._log_memory_info(f"✅ Completed {op_name}")
                     return result
@@ -4,24 +4,36 @@ Converts various document formats to PDF with OCR capabilities
 """
 
 import os
+import io
+import re
 import sys
+import json
+import time
+import sqlite3
+from array import array
 from pathlib import Path
 import logging
-import tempfile
 import shutil
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate, repeat
 
 try:
-    from PIL import Image
+    from PIL import Image, ImageSequence
 except ImportError:
     Image = None
 
 import pytesseract
-import imutils
 import numpy as np
 
+try:
+    from .error_handling import PoolUnavailableError, map_in_process_pool
+except ImportError:
+    from error_handling import PoolUnavailableError, map_in_process_pool
+
 try:
     from docx import Document
+    from docx.oxml.ns import nsmap, qn
+    from lxml import etree
 except ImportError:
     Document = None
 
@@ -31,6 +43,7 @@ try:
     from reportlab.lib.units import inch
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.lib.utils import ImageReader
 except ImportError:
     canvas = None
 
@@ -39,10 +52,377 @@ try:
 except ImportError:
     fitz = None
 
+# Optional numba import for JIT-compiled layout heuristics
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional tesserocr import - in-process Tesseract API (no subprocess per call)
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+
+# Tesseract OSD configuration used for orientation detection
+OSD_CONFIG = '--psm 0 -c min_characters_to_try=5'
+
+# Upper bound on worker processes used for per-page OCR
+MAX_OCR_WORKERS = 4
+
+# OCR rasterization: render at OCR_MAX_ZOOM, or at a scanned page's own image
+# resolution when that is lower (finer rendering only interpolates), but never
+# below OCR_MIN_ZOOM; the long side of oversized pages stays within
+# OCR_MAX_RENDER_PX pixels. A page counts as a scan when a single image covers at
+# least SCAN_IMAGE_MIN_COVERAGE of it.
+# OSD only needs coarse glyph shapes, so it gets its own low-resolution render.
+OCR_MAX_ZOOM = 2.0
+OCR_MIN_ZOOM = 1.0
+OCR_MAX_RENDER_PX = 2400
+SCAN_IMAGE_MIN_COVERAGE = 0.9
+OSD_ZOOM = 1.0
+
+# A PDF needs OCR when its first OCR_PROBE_PAGES pages hold fewer than
+# OCR_MIN_TEXT_CHARS characters of extractable text
+OCR_PROBE_PAGES = 3
+OCR_MIN_TEXT_CHARS = 50
+
+# Distinct words remembered per font before the width cache is reset
+WORD_WIDTH_CACHE_MAX = 100_000
+
+# Line mappings for every PDF in an output folder share one SQLite file,
+# replacing the per-PDF .linemap.json sidecars (still read for older outputs)
+LINEMAP_DB_NAME = "_linemaps.sqlite"
+_LINEMAP_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS linemaps ("
+    "pdf TEXT PRIMARY KEY, total_lines INTEGER, positions BLOB, "
+    "conversion_type TEXT, line_height REAL, font_size REAL, created REAL)"
+)
+
+# Paragraphs with at least this many words find line breaks with numpy searchsorted;
+# below it the per-call overhead outweighs the scalar scan
+WRAP_SEARCHSORTED_MIN_WORDS = 64
+
+# Pages with more extractable text than this are kept as-is during OCR
+OCR_PAGE_TEXT_CHARS = 100
+
+# Standalone span text that looks like an existing line number
+_LINE_NUMBER_RE = re.compile(r"\d{1,4}")
+
+# PIL transpose operation undoing each clockwise rotation Tesseract can report
+# (PIL rotates counter-clockwise). Transposes are lossless stride permutations.
+_TRANSPOSE_FOR_ROTATION = {
+    90: Image.Transpose.ROTATE_270,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_90,
+} if Image else {}
+
+# Run content python-docx's Paragraph.text reads (direct runs and hyperlink runs),
+# selected with one compiled XPath per paragraph instead of one query per run
+_DOCX_RUN_TEXT_TAGS = ("w:t", "w:tab", "w:br", "w:cr", "w:noBreakHyphen", "w:ptab")
+_DOCX_PARAGRAPH_TEXT_XPATH = etree.XPath(
+    " | ".join(f"{parent}/{tag}" for parent in ("w:r", "w:hyperlink/w:r") for tag in _DOCX_RUN_TEXT_TAGS),
+    namespaces={"w": nsmap["w"]},
+) if Document else None
+
+# Per-process tesserocr API, loaded once and reused for every page
+_tesseract_api = None
+_tesseract_api_failed = False
+
+
+def _span_rotation_count(bboxes, text_lens, flags):
+    """
+    Count spans that look rotated 90°
+
+    A span counts once for the PyMuPDF rotation flag (bit 3) and once when its
+    glyphs are much taller than they are wide.
+
+    Args:
+        bboxes (np.ndarray): (N, 4) float32 span bounding boxes
+        text_lens (np.ndarray): (N,) int32 stripped text lengths
+        flags (np.ndarray): (N,) int32 span flags
+
+    Returns:
+        int: Number of rotation hits
+    """
+    char_widths = (bboxes[:, 2] - bboxes[:, 0]) / np.maximum(text_lens, 1)
+    char_heights = bboxes[:, 3] - bboxes[:, 1]
+    return int(np.count_nonzero(flags & 8) + np.count_nonzero(char_heights > char_widths * 4))
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _span_rotation_count(bboxes, text_lens, flags):  # noqa: F811
+        rotated_count = 0
+        for i in range(bboxes.shape[0]):
+            if flags[i] & 8:
+                rotated_count += 1
+            char_width = (bboxes[i, 2] - bboxes[i, 0]) / max(text_lens[i], 1)
+            char_height = bboxes[i, 3] - bboxes[i, 1]
+            if char_height > char_width * 4:
+                rotated_count += 1
+        return rotated_count
+
+
+def _get_tesseract_api():
+    """
+    Return this process's long-lived tesserocr API, or None if unavailable
+
+    The API (and its language models) is loaded on first use and kept for the
+    lifetime of the process, so OCR workers pay the start-up cost once.
+    """
+    global _tesseract_api, _tesseract_api_failed
+    if tesserocr is None or _tesseract_api_failed:
+        return None
+    if _tesseract_api is None:
+        try:
+            _tesseract_api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.AUTO_OSD)
+        except Exception:
+            _tesseract_api_failed = True  # e.g. missing tessdata - use pytesseract
+            return None
+    return _tesseract_api
+
+
+def _detect_rotation(img):
+    """
+    Run Tesseract OSD on an in-memory image
+
+    Returns:
+        tuple: (rotation_needed, confidence) with rotation in clockwise degrees
+    """
+    api = _get_tesseract_api()
+    if api is not None:
+        api.SetImage(img)
+        osd = api.DetectOrientationScript()
+        if not osd:
+            raise RuntimeError("Tesseract OSD returned no result")
+        # orient_deg is the detected page orientation; undo it clockwise
+        return (360 - osd['orient_deg']) % 360, osd['orient_conf']
+
+    osd_data = pytesseract.image_to_osd(img, config=OSD_CONFIG,
+                                        output_type=pytesseract.Output.DICT)
+    return osd_data['rotate'], osd_data['orientation_conf']
+
+
+def _image_to_text(img):
+    """OCR an in-memory image, preferring the in-process tesserocr API"""
+    api = _get_tesseract_api()
+    if api is not None:
+        api.SetImage(img)
+        return api.GetUTF8Text()
+    return pytesseract.image_to_string(img)
+
+
+def _orient_image(img, osd_img=None):
+    """
+    Detect orientation with Tesseract OSD and rotate an in-memory image
+
+    Args:
+        img (PIL.Image.Image): RGB page image
+        osd_img (PIL.Image.Image): Optional lower-resolution render of the same
+                                   page to run OSD on instead of img
+
+    Returns:
+        tuple: (corrected_image, rotation_applied) where rotation_applied is
+               the clockwise rotation in degrees (0, 90, 180, 270)
+    """
+    try:
+        rotation_needed, confidence = _detect_rotation(osd_img if osd_img is not None else img)
+    except Exception:
+        return img, 0  # OSD failed - use the image as rendered
+
+    if confidence > 1.0 and rotation_needed in _TRANSPOSE_FOR_ROTATION:
+        return img.transpose(_TRANSPOSE_FOR_ROTATION[rotation_needed]), rotation_needed
+    return img, 0
+
+
+def _ocr_zoom(page, max_zoom=OCR_MAX_ZOOM):
+    """Pick the rasterization zoom for OCR-ing a page"""
+    zoom = max_zoom
+    page_rect = page.rect
+    long_side = max(page_rect.width, page_rect.height)
+
+    # A scanned page holds no more detail than its image, so don't render past it
+    try:
+        images = page.get_image_info()
+    except Exception:
+        images = []
+    page_area = page_rect.width * page_rect.height
+    for info in images:
+        bbox = fitz.Rect(info['bbox'])
+        if page_area and bbox.width * bbox.height >= SCAN_IMAGE_MIN_COVERAGE * page_area:
+            native_zoom = max(info['width'], info['height']) / max(bbox.width, bbox.height)
+            zoom = min(zoom, max(native_zoom, OCR_MIN_ZOOM))
+            break
+
+    if long_side * zoom > OCR_MAX_RENDER_PX:
+        zoom = OCR_MAX_RENDER_PX / long_side
+    return zoom
+
+
+def _render_page_rgb(page, zoom):
+    """
+    Render a PyMuPDF page to an RGB PIL image at the given zoom
+
+    The image wraps the pixmap's sample buffer without copying it, so the
+    pixmap is returned too and must be kept alive while the image is in use.
+
+    Returns:
+        tuple: (image, pixmap)
+    """
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1)
+    return img, pix
+
+
+def _ocr_page_worker(pdf_path, page_index, zoom):
+    """
+    Rasterize, orient and OCR a single PDF page
+
+    Module-level so it can run inside a ProcessPoolExecutor worker. The
+    document is opened independently in each call because PyMuPDF documents
+    cannot be shared across processes. The page stays a single in-memory
+    PIL image through OSD and OCR and is encoded once, as JPEG, at the end.
+
+    Args:
+        pdf_path (str): Path to the source PDF
+        page_index (int): Zero-based page index
+        zoom (float): Maximum rasterization zoom factor (see _ocr_zoom)
+
+    Returns:
+        tuple: (page_index, corrected_jpeg_bytes, ocr_text, rotation, width, height)
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        page = doc[page_index]
+        width, height = page.rect.width, page.rect.height
+        img, pix = _render_page_rgb(page, _ocr_zoom(page, zoom))
+        osd_img, osd_pix = _render_page_rgb(page, OSD_ZOOM)
+    finally:
+        doc.close()
+
+    # Detect (on the low-resolution probe) and correct orientation before OCR
+    img, rotation = _orient_image(img, osd_img)
+
+    ocr_text = _image_to_text(img)
+
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=90)
+    return page_index, buffer.getvalue(), ocr_text, rotation, width, height
+
+
+def _ocr_tiff_frame_worker(tiff_path, frame_index):
+    """
+    Orient and OCR a single TIFF frame
+
+    Module-level so it can run inside a ProcessPoolExecutor worker; the TIFF
+    is reopened in the worker so only the frame index crosses the process
+    boundary on the way in.
+
+    Args:
+        tiff_path (str): Path to the source TIFF
+        frame_index (int): Zero-based frame index
+
+    Returns:
+        tuple: (frame_index, corrected_image, ocr_text, rotation)
+    """
+    with Image.open(tiff_path) as tiff:
+        tiff.seek(frame_index)
+        img = tiff.convert('RGB')
+
+    img, rotation = _orient_image(img)
+    return frame_index, img, _image_to_text(img), rotation
+
+
+def _convert_one(input_path, output_path, perform_ocr, tesseract_cmd):
+    """
+    Convert a single file to PDF inside a batch worker process
+
+    Module-level so it can run inside a ProcessPoolExecutor worker. Log
+    messages are collected and returned so the parent converter can relay
+    them through its own log callback.
+
+    Args:
+        input_path (str): Path to input file
+        output_path (str): Path for output PDF file
+        perform_ocr (bool): Whether to perform OCR on images
+        tesseract_cmd (str): Tesseract executable configured in the parent
+
+    Returns:
+        tuple: (convert_to_pdf result, log messages)
+    """
+    if tesseract_cmd and pytesseract.pytesseract.tesseract_cmd != tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        
+    messages = []
+    converter = PDFConverter(log_callback=messages.append)
+    try:
+        result = converter.convert_to_pdf(input_path, output_path, perform_ocr)
+    finally:
+        converter.shutdown()
+    return result, messages
+
+
+def _open_linemap_db(db_path):
+    """Open (creating if needed) an output folder's line mapping database"""
+    conn = sqlite3.connect(str(db_path), isolation_level=None, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(_LINEMAP_SCHEMA)
+    return conn
+
+
+def _write_line_mapping(connections, db_path, row):
+    """
+    Insert one PDF's line mapping row (runs on the converter's metadata thread)
+
+    Args:
+        connections (dict): Open connections by database path, owned by the metadata thread
+        db_path (Path): Line mapping database for the PDF's folder
+        row (tuple): Values for the linemaps table, in column order
+    """
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = connections[db_path] = _open_linemap_db(db_path)
+    conn.execute("INSERT OR REPLACE INTO linemaps VALUES (?, ?, ?, ?, ?, ?, ?)", row)
+
+
+def _close_linemap_dbs(connections):
+    """Close the metadata thread's line mapping connections"""
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
+def _docx_paragraph_texts(doc):
+    """
+    Yield the text of each top-level paragraph of a Word document
+    
+    Matches python-docx's Paragraph.text (tabs and line breaks become "\\t" and
+    "\\n") but reads the run content straight from the XML in one XPath query.
+    
+    Args:
+        doc: python-docx Document
+        
+    Returns:
+        generator: Paragraph strings in document order
+    """
+    for p in doc.element.body.iterchildren(qn('w:p')):
+        try:
+            yield "".join(map(str, _DOCX_PARAGRAPH_TEXT_XPATH(p)))
+        except Exception:
+            yield p.text
+
 
 class PDFConverter:
     """Converts various document formats to PDF with OCR support and enhanced line detection"""
     
+    # Dependency check results are shared by every instance so that batch jobs
+    # creating many converters only probe the tesseract binary once per process
+    _DEPS_CHECKED = False
+    _TESSERACT_OK = None
+    
     def __init__(self, log_callback=None, tesseract_path=None):
         """
         Initialize the PDF converter
@@ -54,6 +434,23 @@ class PDFConverter:
         self.log_callback = log_callback
         self.conversion_errors = []
         
+        # Per-(font, size) word width caches for the enhanced Word converter
+        self._word_width_cache = {}
+        
+        # Per-font glyph widths for ASCII characters (1000-unit em), built lazily
+        self._ascii_width_tables = {}
+        
+        # Text statistics from the most recent _analyze_pdf_content run, as
+        # (pdf_path, analysis) so convert_to_pdf can skip reopening the PDF
+        self._last_pdf_analysis = None
+        
+        # Line mappings are written on a single background thread so the next
+        # conversion can start right away; pending writes keyed by PDF path, and
+        # database connections owned (and only touched) by that thread
+        self._metadata_pool = None
+        self._pending_line_mappings = {}
+        self._mapping_dbs = {}
+        
         # Document type classification for processing strategy
         self.document_types = {
             'HIGH_ACCURACY': ['word', 'text'],  # 100% accurate line detection
@@ -65,6 +462,7 @@ class PDFConverter:
         # Set up tesseract path if provided
         if tesseract_path and pytesseract:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
+            PDFConverter._DEPS_CHECKED = False  # Different binary - probe again
             
         # Check for required dependencies
         self._check_dependencies()
@@ -77,7 +475,11 @@ class PDFConverter:
             print(message)
             
     def _check_dependencies(self):
-        """Check if required dependencies are available"""
+        """Check if required dependencies are available (once per process)"""
+        if PDFConverter._DEPS_CHECKED:
+            return
+        PDFConverter._DEPS_CHECKED = True
+        
         missing_deps = []
         
         if not Image:
@@ -99,8 +501,10 @@ class PDFConverter:
         if pytesseract:
             try:
                 pytesseract.get_tesseract_version()
+                PDFConverter._TESSERACT_OK = True
                 self.log("Tesseract OCR found and working")
             except Exception as e:
+                PDFConverter._TESSERACT_OK = False
                 self.log(f"Warning: Tesseract OCR not found or not working: {e}")
                 self.log("OCR functionality will not be available")
                 
@@ -150,6 +554,7 @@ class PDFConverter:
         Returns:
             tuple: (content_type, confidence_score, layout_warnings)
         """
+        self._last_pdf_analysis = None
         if not fitz:
             return 'image_based', 0.5, []
             
@@ -163,6 +568,9 @@ class PDFConverter:
             # Sample first 5 pages for analysis
             sample_pages = min(5, total_pages)
             
+            # Text found on the pages _pdf_needs_ocr would sample
+            ocr_probe_chars = 0
+            
             # Track layout characteristics across pages
             rotated_text_pages = 0
             multi_column_pages = 0
@@ -171,9 +579,12 @@ class PDFConverter:
             for page_num in range(sample_pages):
                 page = doc[page_num]
                 
-                # Count extractable text characters
-                text = page.get_text()
-                total_chars += len(text.strip())
+                # Count extractable text characters (length probe only, so skip
+                # ligature/whitespace post-processing and geometric sorting)
+                page_chars = len(page.get_text("text", flags=0, sort=False).strip())
+                total_chars += page_chars
+                if page_num < OCR_PROBE_PAGES:
+                    ocr_probe_chars += page_chars
                 
                 # Count images
                 images = page.get_images()
@@ -192,6 +603,14 @@ class PDFConverter:
                         empty_with_numbers_pages += 1
                 
                 layout_warnings.extend(page_warnings)
+                
+                # Stop sampling once the classification is already clear
+                if self._pdf_classification_settled(page_num, total_chars, total_images):
+                    if page_num + 1 < sample_pages:
+                        self.log(f"PDF analysis short-circuited after {page_num + 1}/{sample_pages} sample pages: "
+                                 f"{os.path.basename(pdf_path)}")
+                    sample_pages = page_num + 1
+                    break
             
             doc.close()
             
@@ -207,6 +626,11 @@ class PDFConverter:
             chars_per_page = total_chars / sample_pages
             images_per_page = total_images / sample_pages
             
+            self._last_pdf_analysis = (str(pdf_path), {
+                'text_chars_per_page': chars_per_page,
+                'needs_ocr': ocr_probe_chars < OCR_MIN_TEXT_CHARS,
+            })
+            
             if chars_per_page > 200:  # Rich text content
                 if images_per_page < 2:
                     return 'text_based', 0.9, layout_warnings
@@ -225,6 +649,27 @@ class PDFConverter:
             self.log(f"Error analyzing PDF content: {e}")
             return 'image_based', 0.3, [f"❌ Analysis failed: {str(e)}"]
 
+    def _pdf_classification_settled(self, page_num, total_chars, total_images):
+        """
+        Check whether the pages sampled so far already decide the classification
+        
+        Args:
+            page_num: Zero-based index of the last sampled page
+            total_chars: Text characters found so far
+            total_images: Images found so far
+            
+        Returns:
+            bool: True if further sampling cannot change the outcome in practice
+        """
+        # Plenty of text and no images - clearly text-based
+        if total_chars > 1000 and total_images == 0:
+            return True
+        # No text at all across image-bearing pages - clearly a scan. Wait until
+        # every OCR probe page has been seen so the cached needs-OCR check holds.
+        if total_chars == 0 and total_images > 2 and page_num >= OCR_PROBE_PAGES - 1:
+            return True
+        return False
+        
     def _detect_unusual_layout(self, page, page_num):
         """
         Detect unusual PDF layouts that may cause line numbering issues
@@ -251,14 +696,17 @@ class PDFConverter:
             text_blocks = [b for b in blocks if "lines" in b]
             
             # 1. DETECT ROTATED TEXT (90-degree rotation)
-            rotated_spans = 0
             total_spans = 0
+            span_bboxes = []
+            span_text_lens = []
+            span_flags = []
             
             # 2. DETECT MULTI-COLUMN LAYOUT
             x_positions = []
             
             # 3. DETECT EMPTY PAGES WITH EXISTING LINE NUMBERS
             digit_only_text = []
+            non_digit_count = 0
             
             for block in text_blocks:
                 for line in block.get("lines", []):
@@ -274,60 +722,48 @@ class PDFConverter:
                         bbox = span.get("bbox", [0, 0, 0, 0])
                         x_positions.append(bbox[0])  # Left edge position
                         
-                        # ROTATED TEXT DETECTION
-                        # Check if text orientation is unusual
-                        flags = span.get("flags", 0)
-                        if flags & 2**3:  # Text rotation flag (rough heuristic)
-                            rotated_spans += 1
-                        
-                        # Alternative: Check character spacing/width ratios
-                        # Only flag as potentially rotated if characters are extremely tall (likely actually rotated)
-                        char_width = (bbox[2] - bbox[0]) / max(len(text), 1)
-                        char_height = bbox[3] - bbox[1]
-                        if char_height > char_width * 4:  # Much higher threshold for actual rotation
-                            rotated_spans += 1
+                        # Numeric rotation heuristics are evaluated in bulk below
+                        span_bboxes.append(bbox)
+                        span_text_lens.append(len(text))
+                        span_flags.append(span.get("flags", 0))
                         
                         # EXISTING LINE NUMBERS DETECTION
                         # Check for standalone numbers (possible existing line numbers)
-                        if text.isdigit() and len(text) <= 4:
+                        if _LINE_NUMBER_RE.fullmatch(text):
                             digit_only_text.append(int(text))
+                        else:
+                            non_digit_count += 1
             
             # ANALYSIS & WARNINGS
             
             # 1. Rotated text warning
             if total_spans > 0:
+                rotated_spans = 0
+                if span_bboxes:
+                    rotated_spans = _span_rotation_count(
+                        np.asarray(span_bboxes, dtype=np.float32).reshape(-1, 4),
+                        np.asarray(span_text_lens, dtype=np.int32),
+                        np.asarray(span_flags, dtype=np.int32),
+                    )
                 rotation_ratio = rotated_spans / total_spans
                 if rotation_ratio > 0.3:  # More than 30% of text appears rotated
                     warnings.append(f"🔄 Page {page_num}: {rotation_ratio:.1%} of text appears rotated 90°")
             
             # 2. Multi-column detection
             if len(x_positions) > 10:  # Need sufficient data points
-                # Find distinct column positions (cluster X coordinates)
-                x_positions.sort()
-                columns = []
-                current_column = x_positions[0]
-                
-                for x in x_positions[1:]:
-                    if x - current_column > 100:  # New column if >100pt gap
-                        columns.append(current_column)
-                        current_column = x
-                columns.append(current_column)
+                column_count = self._count_text_columns(x_positions, page.rect)
                 
-                if len(columns) >= 2:
-                    warnings.append(f"📊 Page {page_num}: Multi-column layout detected ({len(columns)} columns)")
+                if column_count >= 2:
+                    warnings.append(f"📊 Page {page_num}: Multi-column layout detected ({column_count} columns)")
             
             # 3. Empty page with existing line numbers
-            non_digit_text = [text for block in text_blocks 
-                            for line in block.get("lines", []) 
-                            for span in line.get("spans", [])
-                            if (text := span.get("text", "").strip()) and not text.isdigit()]
-            
-            if len(digit_only_text) > 5 and len(non_digit_text) < 3:
+            if len(digit_only_text) > 5 and non_digit_count < 3:
                 # Check if digits form a sequence (likely existing line numbers)
-                digit_only_text.sort()
-                if len(digit_only_text) > 1:
-                    gaps = [digit_only_text[i+1] - digit_only_text[i] for i in range(len(digit_only_text)-1)]
-                    avg_gap = sum(gaps) / len(gaps) if gaps else 0
+                digits = np.asarray(digit_only_text)
+                digits.sort()
+                if digits.size > 1:
+                    gaps = np.diff(digits)
+                    avg_gap = gaps.mean() if gaps.size else 0
                     
                     if 0.5 <= avg_gap <= 2:  # Sequential-ish numbers
                         warnings.append(f"📝 Page {page_num}: Appears empty but contains {len(digit_only_text)} sequential numbers (existing line numbers?)")
@@ -346,6 +782,31 @@ class PDFConverter:
         
         return warnings
 
+    def _count_text_columns(self, x_positions, page_rect):
+        """
+        Estimate the number of text columns from span left edges
+        
+        Left edges are binned into 20pt buckets across the page; buckets holding
+        a meaningful share of spans are column starts, and runs of such buckets
+        more than 100pt apart are separate columns. Sparse outliers (margin
+        notes, page numbers) never reach the threshold, so they are not counted.
+        
+        Args:
+            x_positions: Left edge of every non-empty span
+            page_rect: PyMuPDF page rectangle
+            
+        Returns:
+            int: Number of detected columns (0 if no clear column starts)
+        """
+        xs = np.asarray(x_positions, dtype=np.float32)
+        bins = max(1, int(page_rect.width // 20))
+        hist, _ = np.histogram(np.clip(xs, page_rect.x0, page_rect.x1), bins=bins,
+                               range=(page_rect.x0, page_rect.x1))
+        peaks = np.flatnonzero(hist > max(3, xs.size * 0.05))
+        if peaks.size == 0:
+            return 0
+        return int(np.count_nonzero(np.diff(peaks) > 5)) + 1
+        
     def convert_to_pdf(self, input_path, output_path, perform_ocr=True):
         """
         Convert a file to PDF format using optimal strategy based on document type
@@ -377,7 +838,8 @@ class PDFConverter:
         
         try:
             if file_ext == '.pdf':
-                success = self._handle_existing_pdf(input_path, output_path, perform_ocr, doc_subtype)
+                success = self._handle_existing_pdf(input_path, output_path, perform_ocr, doc_subtype,
+                                                    analysis=self._cached_pdf_analysis(input_path))
             elif file_ext in ['.tiff', '.tif']:
                 success = self._convert_tiff_to_pdf(input_path, output_path, perform_ocr)
             elif file_ext in ['.docx', '.doc']:
@@ -403,130 +865,180 @@ class PDFConverter:
             })
             return False, doc_subtype, f'Conversion error: {str(e)}'
             
-    def _handle_existing_pdf(self, input_path, output_path, perform_ocr=True, doc_subtype='pdf_text'):
-        """Handle PDF files with strategy based on document type"""
-        # Check if input and output are the same file
-        input_resolved = Path(input_path).resolve()
-        output_resolved = Path(output_path).resolve()
+    def convert_batch(self, pairs, perform_ocr=True, max_workers=None):
+        """
+        Convert many independent files to PDF, in a process pool when worthwhile
+        
+        Args:
+            pairs: Iterable of (input_path, output_path)
+            perform_ocr (bool): Whether to perform OCR on images
+            max_workers (int): Worker processes (defaults to the CPU count)
+            
+        Returns:
+            list: convert_to_pdf results, in the order of pairs
+        """
+        pairs = [(str(input_path), str(output_path)) for input_path, output_path in pairs]
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+        
+        if max_workers > 1:
+            input_paths, output_paths = zip(*pairs)
+            try:
+                outcomes = map_in_process_pool(_convert_one, input_paths, output_paths,
+                                               repeat(perform_ocr),
+                                               repeat(pytesseract.pytesseract.tesseract_cmd),
+                                               max_workers=max_workers)
+                results = []
+                for result, messages in outcomes:
+                    for message in messages:
+                        self.log(message)
+                    results.append(result)
+                return results
+            except PoolUnavailableError as e:
+                self.log(f"⚠️  Parallel conversion unavailable ({e}) - processing sequentially")
+                
+        return [self.convert_to_pdf(input_path, output_path, perform_ocr)
+                for input_path, output_path in pairs]
+            
+    def _cached_pdf_analysis(self, pdf_path):
+        """Return the text statistics from classifying pdf_path, if still cached"""
+        if self._last_pdf_analysis and self._last_pdf_analysis[0] == str(pdf_path):
+            return self._last_pdf_analysis[1]
+        return None
+        
+    def _handle_existing_pdf(self, input_path, output_path, perform_ocr=True, doc_subtype='pdf_text',
+                             analysis=None):
+        """
+        Handle PDF files with strategy based on document type
         
-        if input_resolved == output_resolved:
-            self.log(f"PDF already in correct location (no conversion needed): {Path(input_path).name}")
+        Args:
+            analysis (dict): Optional text statistics from _analyze_pdf_content,
+                             used to avoid reopening the PDF
+        """
+        # Check if input and output are the same file (one stat per side;
+        # a missing output raises OSError and simply means "not the same")
+        try:
+            same_file = os.path.samefile(input_path, output_path)
+        except OSError:
+            same_file = False
+            
+        if same_file:
+            self.log(f"PDF already in correct location (no conversion needed): {os.path.basename(input_path)}")
             return True
             
         if not perform_ocr:
             # Just copy the file
             shutil.copy2(input_path, output_path)
-            self.log(f"Copied PDF: {Path(input_path).name}")
+            self.log(f"Copied PDF: {os.path.basename(input_path)}")
             return True
         
         # Processing strategy based on document type
         if doc_subtype == 'pdf_text':
             # High-quality text PDF - minimal processing needed
             shutil.copy2(input_path, output_path)
-            self.log(f"Text-based PDF copied (high line accuracy expected): {Path(input_path).name}")
+            self.log(f"Text-based PDF copied (high line accuracy expected): {os.path.basename(input_path)}")
             return True
         elif doc_subtype == 'pdf_mixed':
             # Mixed content - copy but note potential line accuracy issues
             shutil.copy2(input_path, output_path)
-            self.log(f"Mixed-content PDF copied (moderate line accuracy): {Path(input_path).name}")
+            self.log(f"Mixed-content PDF copied (moderate line accuracy): {os.path.basename(input_path)}")
             return True
         else:
             # Image-based or unknown - may need OCR
-            if self._pdf_needs_ocr(input_path):
+            if self._pdf_needs_ocr(input_path, analysis):
                 return self._ocr_pdf(input_path, output_path)
             else:
                 shutil.copy2(input_path, output_path)
-                self.log(f"PDF copied with fallback processing: {Path(input_path).name}")
+                self.log(f"PDF copied with fallback processing: {os.path.basename(input_path)}")
                 return True
             
-    def _pdf_needs_ocr(self, pdf_path):
+    def _pdf_needs_ocr(self, pdf_path, analysis=None):
         """Check if a PDF needs OCR (has no extractable text)"""
+        if analysis is not None:
+            return analysis['needs_ocr']
+            
         if not fitz:
             return False
             
         try:
             doc = fitz.open(pdf_path)
-            total_text = ""
+            total_text = 0
             
-            # Check first few pages for text
-            for page_num in range(min(3, doc.page_count)):
+            # Check first few pages for text, stopping once there is clearly enough
+            for page_num in range(min(OCR_PROBE_PAGES, doc.page_count)):
                 page = doc[page_num]
-                text = page.get_text()
-                total_text += text.strip()
+                total_text += len(page.get_text("text", flags=0, sort=False).strip())
+                if total_text >= OCR_MIN_TEXT_CHARS:
+                    break
                 
             doc.close()
             
             # If we found minimal text, it probably needs OCR
-            return len(total_text) < 50
+            return total_text < OCR_MIN_TEXT_CHARS
             
         except Exception as e:
             self.log(f"Error checking PDF text content: {e}")
             return False
             
     def _ocr_pdf(self, input_path, output_path):
-        """Perform OCR on a PDF file"""
+        """Perform OCR on a PDF file, spreading pages across worker processes"""
         if not pytesseract or not fitz:
             self.log("OCR not available - copying PDF as-is")
             shutil.copy2(input_path, output_path)
             return True
             
         try:
-            # Open the PDF
             doc = fitz.open(input_path)
-            new_doc = fitz.open()  # Create new document
-            
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                
-                # Convert page to image
-                mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better OCR
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("png")
+            page_count = doc.page_count
+            try:
+                # Pages that already carry searchable text are copied verbatim -
+                # only the rest are rasterized, oriented and OCR'd
+                ocr_page_indices = [
+                    page_index for page_index in range(page_count)
+                    if len(doc[page_index].get_text("text", flags=0, sort=False).strip()) <= OCR_PAGE_TEXT_CHARS
+                ]
+                ocr_results = {result[0]: result
+                               for result in self._map_ocr_tasks(_ocr_page_worker, len(ocr_page_indices),
+                                                                 repeat(str(input_path)), ocr_page_indices,
+                                                                 repeat(OCR_MAX_ZOOM))}
                 
-                # Save image temporarily
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_img:
-                    tmp_img.write(img_data)
-                    tmp_img_path = tmp_img.name
-                    
+                # PyMuPDF documents are not process-safe, so assemble pages sequentially here
+                new_doc = fitz.open()  # Create new document
                 try:
-                    # NEW: Detect and correct orientation before OCR
-                    corrected_img_path, rotation_applied = self._detect_and_correct_orientation(tmp_img_path)
-                    
-                    # Perform OCR on corrected image
-                    ocr_text = pytesseract.image_to_string(Image.open(corrected_img_path))
-                    
-                    # Create new page with correct dimensions (swap if rotated 90/270)
-                    if rotation_applied in (90, 270):
-                        # Swap width and height for 90/270 degree rotations
-                        new_page = new_doc.new_page(width=page.rect.height, height=page.rect.width)
-                        page_rect = fitz.Rect(0, 0, page.rect.height, page.rect.width)
-                    else:
-                        new_page = new_doc.new_page(width=page.rect.width, height=page.rect.height)
-                        page_rect = page.rect
+                    for page_index in range(page_count):
+                        if page_index not in ocr_results:
+                            page = doc[page_index]
+                            new_page = new_doc.new_page(width=page.rect.width, height=page.rect.height)
+                            new_page.show_pdf_page(new_page.rect, doc, page_index)
+                            continue
+                        
+                        _, image_bytes, ocr_text, rotation_applied, width, height = ocr_results[page_index]
+                        if rotation_applied:
+                            self.log(f"🔄 Page {page_index + 1}: corrected orientation by {rotation_applied}°")
                     
-                    # Insert the corrected image
-                    new_page.insert_image(page_rect, filename=corrected_img_path)
+                        # Create new page with correct dimensions (swap if rotated 90/270)
+                        if rotation_applied in (90, 270):
+                            width, height = height, width
+                        new_page = new_doc.new_page(width=width, height=height)
+                        page_rect = fitz.Rect(0, 0, width, height)
                     
-                    # Add invisible text overlay for searchability
-                    if ocr_text.strip():
-                        text_rect = page_rect
-                        new_page.insert_textbox(text_rect, ocr_text, 
-                                              fontsize=8, color=(1, 1, 1),  # White text (invisible)
-                                              overlay=True)
+                        # Insert the corrected image
+                        new_page.insert_image(page_rect, stream=image_bytes)
                     
+                        # Add invisible text overlay for searchability
+                        if ocr_text.strip():
+                            new_page.insert_textbox(page_rect, ocr_text, 
+                                                  fontsize=8, color=(1, 1, 1),  # White text (invisible)
+                                                  overlay=True)
+                        
+                    # Save the new PDF
+                    new_doc.save(output_path)
                 finally:
-                    # Clean up temporary images
-                    if os.path.exists(tmp_img_path):
-                        os.unlink(tmp_img_path)
-                    if 'corrected_img_path' in locals() and corrected_img_path != tmp_img_path and os.path.exists(corrected_img_path):
-                        os.unlink(corrected_img_path)
-                    
-            # Save the new PDF
-            new_doc.save(output_path)
-            new_doc.close()
-            doc.close()
+                    new_doc.close()
+            finally:
+                doc.close()
             
-            self.log(f"OCR completed for PDF: {Path(input_path).name}")
+            self.log(f"OCR completed for PDF: {os.path.basename(input_path)} "
+                     f"({len(ocr_results)} page(s) OCR'd, {page_count - len(ocr_results)} copied with existing text)")
             return True
             
         except Exception as e:
@@ -535,118 +1047,172 @@ class PDFConverter:
             shutil.copy2(input_path, output_path)
             return True
             
+    def _map_ocr_tasks(self, worker, task_count, *task_args):
+        """
+        Run an OCR worker over its task arguments, in a process pool when worthwhile
+        
+        Args:
+            worker: Module-level worker function
+            task_count: Number of tasks
+            *task_args: Argument iterables, as for map()
+            
+        Returns:
+            list: Worker results in task order
+        """
+        max_workers = min(os.cpu_count() or 1, MAX_OCR_WORKERS, task_count)
+        if max_workers > 1:
+            try:
+                return map_in_process_pool(worker, *task_args, max_workers=max_workers)
+            except PoolUnavailableError as e:
+                self.log(f"⚠️  Parallel OCR unavailable ({e}) - processing sequentially")
+                
+        return list(map(worker, *task_args))
+            
     def _convert_tiff_to_pdf(self, input_path, output_path, perform_ocr=True):
-        """Convert TIFF file to PDF with optional OCR"""
+        """Convert a (possibly multi-page) TIFF file to PDF with optional OCR"""
         if not Image:
             self.log("PIL not available for TIFF conversion")
             return False
             
         try:
-            # Open TIFF image
+            # Open TIFF image and read every frame, not just the first
             with Image.open(input_path) as img:
-                # Convert to RGB if necessary
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                    
-                if perform_ocr and pytesseract:
-                    # Save image temporarily for orientation detection
-                    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_img:
-                        img.save(tmp_img.name, "PNG")
-                        tmp_img_path = tmp_img.name
+                frame_count = getattr(img, 'n_frames', 1)
+                if not (perform_ocr and pytesseract):
+                    # Just convert the frames to a single PDF in one pass
+                    frames = [frame.convert('RGB') for frame in ImageSequence.Iterator(img)]
+                    frames[0].save(output_path, "PDF", resolution=300.0,
+                                   save_all=True, append_images=frames[1:])
                     
-                    try:
-                        # NEW: Detect and correct orientation before OCR
-                        corrected_img_path, _ = self._detect_and_correct_orientation(tmp_img_path)
-                        
-                        # Load corrected image and perform OCR
-                        corrected_img = Image.open(corrected_img_path)
-                        ocr_text = pytesseract.image_to_string(corrected_img)
+            if perform_ocr and pytesseract:
+                # Detect and correct orientation, then OCR, one frame per worker
+                frame_results = self._map_ocr_tasks(_ocr_tiff_frame_worker, frame_count,
+                                                    repeat(str(input_path)), range(frame_count))
+                for frame_index, _, _, rotation in frame_results:
+                    if rotation:
+                        self.log(f"🔄 Page {frame_index + 1}: corrected orientation by {rotation}°")
                         
-                        # Create PDF with corrected image and text
-                        self._create_pdf_with_image_and_text(corrected_img, ocr_text, output_path)
-                        
-                    finally:
-                        # Clean up temporary images
-                        if os.path.exists(tmp_img_path):
-                            os.unlink(tmp_img_path)
-                        if 'corrected_img_path' in locals() and corrected_img_path != tmp_img_path and os.path.exists(corrected_img_path):
-                            os.unlink(corrected_img_path)
-                else:
-                    # Just convert image to PDF
-                    img.save(output_path, "PDF", resolution=300.0)
+                # Create PDF with corrected images and text
+                self._create_pdf_with_image_and_text(
+                    [(image, ocr_text) for _, image, ocr_text, _ in frame_results], output_path)
                     
-            self.log(f"Converted TIFF to PDF: {Path(input_path).name}")
+            self.log(f"Converted TIFF to PDF: {os.path.basename(input_path)} ({frame_count} page(s))")
             return True
             
         except Exception as e:
             self.log(f"Error converting TIFF: {e}")
             return False
             
-    def _create_pdf_with_image_and_text(self, image, text, output_path):
-        """Create a PDF with an image and searchable text overlay"""
+    def _create_pdf_with_image_and_text(self, pages, output_path):
+        """
+        Create a PDF with one image page and searchable text overlay per entry
+        
+        Args:
+            pages: List of (PIL image, ocr_text) tuples, one per output page
+            output_path: Path for the output PDF
+        """
+        images = [image for image, _ in pages]
         if not canvas:
-            # Fallback: just save image as PDF
-            image.save(output_path, "PDF", resolution=300.0)
+            # Fallback: just save images as PDF
+            images[0].save(output_path, "PDF", resolution=300.0, save_all=True, append_images=images[1:])
             return
             
         try:
-            # Save image temporarily
-            with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp_img:
-                image.save(tmp_img.name, "JPEG", quality=95)
-                tmp_img_path = tmp_img.name
-                
             # Create PDF
             c = canvas.Canvas(str(output_path), pagesize=letter)
             width, height = letter
             
-            # Add image
-            img_width, img_height = image.size
-            aspect_ratio = img_height / img_width
-            
-            # Scale image to fit page
-            if img_width > img_height:
-                # Landscape orientation
-                img_pdf_width = width - 72  # 1 inch margin
-                img_pdf_height = img_pdf_width * aspect_ratio
-            else:
-                # Portrait orientation
-                img_pdf_height = height - 72  # 1 inch margin
-                img_pdf_width = img_pdf_height / aspect_ratio
+            for image, text in pages:
+                # Encode image in memory for reportlab
+                buffer = io.BytesIO()
+                image.save(buffer, "JPEG", quality=95)
+                buffer.seek(0)
+                img_reader = ImageReader(buffer)
                 
-            # Center image
-            x = (width - img_pdf_width) / 2
-            y = (height - img_pdf_height) / 2
-            
-            c.drawImage(tmp_img_path, x, y, img_pdf_width, img_pdf_height)
-            
-            # Add invisible text for searchability
-            if text.strip():
-                c.setFillColorRGB(1, 1, 1)  # White (invisible)
-                c.setFont("Helvetica", 8)
+                # Add image
+                img_width, img_height = image.size
+                aspect_ratio = img_height / img_width
+                
+                # Scale image to fit page
+                if img_width > img_height:
+                    # Landscape orientation
+                    img_pdf_width = width - 72  # 1 inch margin
+                    img_pdf_height = img_pdf_width * aspect_ratio
+                else:
+                    # Portrait orientation
+                    img_pdf_height = height - 72  # 1 inch margin
+                    img_pdf_width = img_pdf_height / aspect_ratio
+                    
+                # Center image
+                x = (width - img_pdf_width) / 2
+                y = (height - img_pdf_height) / 2
+                
+                c.drawImage(img_reader, x, y, img_pdf_width, img_pdf_height)
+                
+                # Add invisible text for searchability
+                if text.strip():
+                    c.setFillColorRGB(1, 1, 1)  # White (invisible)
+                    c.setFont("Helvetica", 8)
+                    
+                    # Split text into lines and add to PDF
+                    lines = text.split('\n')
+                    text_y = height - 50
+                    for line in lines[:50]:  # Limit to first 50 lines
+                        if line.strip():
+                            c.drawString(50, text_y, line.strip()[:100])  # Limit line length
+                            text_y -= 12
+                            if text_y < 50:
+                                break
+                                
+                c.showPage()
                 
-                # Split text into lines and add to PDF
-                lines = text.split('\n')
-                text_y = height - 50
-                for line in lines[:50]:  # Limit to first 50 lines
-                    if line.strip():
-                        c.drawString(50, text_y, line.strip()[:100])  # Limit line length
-                        text_y -= 12
-                        if text_y < 50:
-                            break
-                            
             c.save()
             
-            # Clean up
-            os.unlink(tmp_img_path)
-            
         except Exception as e:
             self.log(f"Error creating PDF with text overlay: {e}")
             # Fallback
-            image.save(output_path, "PDF", resolution=300.0)
+            images[0].save(output_path, "PDF", resolution=300.0, save_all=True, append_images=images[1:])
+            
+    def _correct_orientation_pil(self, img):
+        """
+        Detect orientation and rotate an in-memory image if needed
+        
+        Args:
+            img (PIL.Image.Image): RGB image
+            
+        Returns:
+            tuple: (corrected_image, rotation_applied)
+                   rotation_applied is degrees rotated (0, 90, 180, 270)
+        """
+        try:
+            rotation_needed, confidence = _detect_rotation(img)
+            
+            # Log detailed detection results
+            self.log(f"🔍 Tesseract OSD results: rotation={rotation_needed}°, confidence={confidence:.1f}")
+            
+            # Lower confidence threshold and add more detailed logging
+            if confidence > 1.0 and rotation_needed in _TRANSPOSE_FOR_ROTATION:
+                # Axis-aligned rotation, so a lossless transpose
+                rotated = img.transpose(_TRANSPOSE_FOR_ROTATION[rotation_needed])
+                self.log(f"🔄 Corrected orientation: rotated {rotation_needed}° (confidence: {confidence:.1f})")
+                return rotated, rotation_needed
+            
+            if rotation_needed == 0:
+                self.log(f"✅ Document orientation correct (confidence: {confidence:.1f})")
+            else:
+                self.log(f"⚠️  Orientation detection confidence too low ({confidence:.1f}) - skipping rotation")
+            return img, 0
+            
+        except Exception as e:
+            self.log(f"⚠️  Orientation detection failed: {e} - using original image")
+            return img, 0  # Fallback to original
             
     def _detect_and_correct_orientation(self, image_path):
         """
-        Detect orientation and rotate image if needed
+        Detect orientation and rotate an image file if needed
+        
+        Thin file-based wrapper around _correct_orientation_pil, kept for
+        callers that only have a path.
         
         Args:
             image_path (str): Path to the image file
@@ -655,54 +1221,24 @@ class PDFConverter:
             tuple: (corrected_image_path, rotation_applied) 
                    rotation_applied is degrees rotated (0, 90, 180, 270)
         """
+        self.log(f"🔍 Starting orientation detection for: {os.path.basename(image_path)}")
         try:
-            # Detect orientation using Tesseract OSD
-            self.log(f"🔍 Starting orientation detection for: {Path(image_path).name}")
-
-            osd_data = pytesseract.image_to_osd(
-                image_path,
-                config='--psm 0 -c min_characters_to_try=5',
-                output_type=pytesseract.Output.DICT
-            )
-
-            rotation_needed = osd_data['rotate']
-            confidence = osd_data['orientation_conf']
-            orientation = osd_data['orientation']
-
-            # Log detailed detection results
-            self.log(f"🔍 Tesseract OSD results: rotation={rotation_needed}°, confidence={confidence:.1f}, orientation={orientation}°")
-
-            # Lower confidence threshold and add more detailed logging
-            if confidence > 1.0 and rotation_needed != 0:
-                # Load and rotate image
-                image = Image.open(image_path)
+            with Image.open(image_path) as image:
                 if image.mode != 'RGB':
                     image = image.convert('RGB')
+                rotated, rotation_applied = self._correct_orientation_pil(image)
                 
-                # Convert to numpy array for imutils
-                image_np = np.array(image)
-                
-                # Rotate with bounds preservation
-                rotated = imutils.rotate_bound(image_np, angle=rotation_needed)
-                
+                if not rotation_applied:
+                    return image_path, 0
+                    
                 # Save corrected image
                 path_obj = Path(image_path)
                 corrected_path = str(path_obj.parent / f"{path_obj.stem}_corrected{path_obj.suffix}")
-                Image.fromarray(rotated).save(corrected_path)
-                
-                self.log(f"🔄 Corrected orientation: rotated {rotation_needed}° (confidence: {confidence:.1f}, detected orientation: {orientation}°)")
-                return corrected_path, rotation_needed
-            else:
-                if rotation_needed == 0:
-                    self.log(f"✅ Document orientation correct (confidence: {confidence:.1f})")
-                else:
-                    self.log(f"⚠️  Orientation detection confidence too low ({confidence:.1f}) - skipping rotation")
-                return image_path, 0
+                rotated.save(corrected_path)
+                return corrected_path, rotation_applied
                 
         except Exception as e:
             self.log(f"⚠️  Orientation detection failed: {e} - using original image")
-            import traceback
-            self.log(f"⚠️  Traceback: {traceback.format_exc()}")
             return image_path, 0  # Fallback to original
             
     def _convert_word_to_pdf_enhanced(self, input_path, output_path):
@@ -715,15 +1251,6 @@ class PDFConverter:
             # Read Word document
             doc = Document(input_path)
             
-            # Extract paragraphs with enhanced processing
-            paragraphs = []
-            for para in doc.paragraphs:
-                text = para.text.strip()
-                if text:  # Only include non-empty paragraphs
-                    paragraphs.append(text)
-                elif len(paragraphs) > 0:  # Add blank line markers
-                    paragraphs.append("")  # Preserve blank lines
-                    
             # Create PDF with precise line tracking
             c = canvas.Canvas(str(output_path), pagesize=letter)
             width, height = letter
@@ -738,73 +1265,83 @@ class PDFConverter:
             usable_width = width - left_margin - right_margin
             
             c.setFont("Helvetica", font_size)
-            y_position = height - top_margin
+            page_top = height - top_margin
+            
+            # Page fill is counted in half-line units (paragraph spacing is half a line);
+            # a page is full once a line ends past the units that fit between the margins
+            half_line = line_height * 0.5
+            units_per_page = int((page_top - bottom_margin) // half_line)
+            page_units = 0
             
-            # Track every line position for perfect alignment
-            line_positions = []
+            # Measure each distinct word once across the whole document
+            space_width = self._fast_width(" ", "Helvetica", font_size)
+            word_widths = self._word_width_table("Helvetica", font_size)
+            
+            # One text object per page: a single BT/ET block, lines advance by leading
+            text_object = self._begin_text_page(c, left_margin, page_top, "Helvetica", font_size, line_height)
+            
+            # Track every line position for perfect alignment; positions are whole
+            # multiples of half a line height, so float32 storage is exact
+            line_positions = array('f')
             total_lines = 0
             
-            for paragraph_text in paragraphs:
-                if not paragraph_text:  # Empty paragraph = blank line
-                    line_positions.append(y_position)
-                    y_position -= line_height
+            # Lay paragraphs out straight from the document; blank ones before the
+            # first paragraph with content are skipped, later ones become blank lines
+            had_content = False
+            for paragraph_text in _docx_paragraph_texts(doc):
+                if not paragraph_text or paragraph_text.isspace():  # Empty paragraph = blank line
+                    if not had_content:
+                        continue
+                    text_object.moveCursor(0, line_height)
+                    line_positions.append(page_top - page_units * half_line)
+                    page_units += 2
                     total_lines += 1
                     
                     # Check for new page
-                    if y_position < bottom_margin:
+                    if page_units > units_per_page:
+                        c.drawText(text_object)
                         c.showPage()
-                        y_position = height - top_margin
-                        c.setFont("Helvetica", font_size)
+                        page_units = 0
+                        text_object = self._begin_text_page(c, left_margin, page_top, "Helvetica", font_size, line_height)
                     continue
                     
                 # Smart word wrapping with exact line tracking
+                had_content = True
                 words = paragraph_text.split()
-                current_line = ""
                 
-                for word in words:
-                    test_line = current_line + (" " if current_line else "") + word
+                # Headings and short bullets fit on one line: measure the whole line once
+                # and only fall back to per-word wrapping when it is too wide
+                paragraph_line = " ".join(words)
+                if self._fast_width(paragraph_line, "Helvetica", font_size) <= usable_width:
+                    paragraph_lines = (paragraph_line,)
+                else:
+                    paragraph_lines = self._wrap_words(words, word_widths, space_width, usable_width,
+                                                       "Helvetica", font_size)
                     
-                    # Check if line fits
-                    if c.stringWidth(test_line, "Helvetica", font_size) <= usable_width:
-                        current_line = test_line
-                    else:
-                        # Current line is full, output it
-                        if current_line:
-                            c.drawString(left_margin, y_position, current_line)
-                            line_positions.append(y_position)
-                            y_position -= line_height
-                            total_lines += 1
-                            
-                            # Check for new page
-                            if y_position < bottom_margin:
-                                c.showPage()
-                                y_position = height - top_margin
-                                c.setFont("Helvetica", font_size)
-                                
-                        current_line = word
-                        
-                # Output the final line of the paragraph
-                if current_line:
-                    c.drawString(left_margin, y_position, current_line)
-                    line_positions.append(y_position)
-                    y_position -= line_height
+                for line_text in paragraph_lines:
+                    text_object.textLine(line_text)
+                    line_positions.append(page_top - page_units * half_line)
+                    page_units += 2
                     total_lines += 1
                     
                     # Check for new page
-                    if y_position < bottom_margin:
+                    if page_units > units_per_page:
+                        c.drawText(text_object)
                         c.showPage()
-                        y_position = height - top_margin
-                        c.setFont("Helvetica", font_size)
+                        page_units = 0
+                        text_object = self._begin_text_page(c, left_margin, page_top, "Helvetica", font_size, line_height)
                         
                 # Add space between paragraphs
-                y_position -= line_height * 0.5
+                text_object.moveCursor(0, half_line)
+                page_units += 1
                         
+            c.drawText(text_object)
             c.save()
             
             # Store line mapping metadata for later use
             self._store_line_mapping(output_path, line_positions, total_lines)
             
-            self.log(f"Enhanced Word conversion completed: {Path(input_path).name} ({total_lines} lines mapped)")
+            self.log(f"Enhanced Word conversion completed: {os.path.basename(input_path)} ({total_lines} lines mapped)")
             return True
             
         except Exception as e:
@@ -812,6 +1349,94 @@ class PDFConverter:
             # Fallback to original method
             return self._convert_word_to_pdf(input_path, output_path)
             
+    def _begin_text_page(self, c, x, y, font_name, font_size, leading):
+        """Start a page's text object at (x, y) with its font and line leading set"""
+        text_object = c.beginText(x, y)
+        text_object.setFont(font_name, font_size, leading)
+        return text_object
+        
+    def _fast_width(self, text, font_name, font_size):
+        """
+        Measure text width in points, using a precomputed table for ASCII text
+        
+        Summing per-character widths from a 128-entry table skips ReportLab's
+        font lookup and encoding work; non-ASCII text falls back to
+        pdfmetrics.stringWidth.
+        """
+        if not text.isascii():
+            return pdfmetrics.stringWidth(text, font_name, font_size)
+            
+        table = self._ascii_width_tables.get(font_name)
+        if table is None:
+            table = self._ascii_width_tables[font_name] = [
+                pdfmetrics.stringWidth(chr(i), font_name, 1000) for i in range(128)
+            ]
+        return sum(map(table.__getitem__, map(ord, text))) * 0.001 * font_size
+        
+    def _wrap_words(self, words, word_widths, space_width, max_width, font_name, font_size):
+        """
+        Greedily wrap words into lines no wider than max_width
+        
+        Each word is measured once (through the word_widths cache); the width of
+        words[i:j] is then prefix[j] - prefix[i] plus the spaces between them.
+        Long paragraphs binary-search each break point with numpy.
+        
+        Args:
+            words: Words of one paragraph
+            word_widths: Word -> width cache for this font and size
+            space_width: Width of a single space
+            max_width: Maximum line width in points
+            font_name: Font used to measure uncached words
+            font_size: Font size in points
+            
+        Returns:
+            list: Line strings; a lone over-wide word still gets its own line
+        """
+        widths = []
+        for word in words:
+            word_width = word_widths.get(word)
+            if word_width is None:
+                word_width = word_widths[word] = self._fast_width(word, font_name, font_size)
+            widths.append(word_width)
+        prefix = [0.0, *accumulate(widths)]
+        word_count = len(words)
+        
+        def fits(start, end):
+            return prefix[end] - prefix[start] + (end - start - 1) * space_width <= max_width
+            
+        # reach[k] = width of the first k words plus one space after each, so words[i:j]
+        # fits when reach[j] <= reach[i] + max_width + space_width; long paragraphs
+        # binary-search that, then nudge the guess so rounding matches the scalar check
+        reach = None
+        if word_count >= WRAP_SEARCHSORTED_MIN_WORDS:
+            reach = np.zeros(word_count + 1)
+            np.cumsum(np.add(widths, space_width), out=reach[1:])
+            
+        lines = []
+        start = 0
+        while start < word_count:
+            if reach is not None:
+                end = int(reach.searchsorted(reach[start] + max_width + space_width, side='right')) - 1
+                end = min(max(end, start + 1), word_count)
+                while end > start + 1 and not fits(start, end):
+                    end -= 1
+            else:
+                end = start + 1
+                
+            # Extend the line while it still fits; a lone over-wide word gets its own line
+            while end < word_count and fits(start, end + 1):
+                end += 1
+            lines.append(" ".join(words[start:end]))
+            start = end
+        return lines
+        
+    def _word_width_table(self, font_name, font_size):
+        """Return the word -> width cache for a font, resetting it if it grows too large"""
+        table = self._word_width_cache.setdefault((font_name, font_size), {})
+        if len(table) > WORD_WIDTH_CACHE_MAX:
+            table.clear()
+        return table
+        
     def _convert_word_to_pdf(self, input_path, output_path):
         """Convert Word document to PDF (fallback method)"""
         if not Document or not canvas:
@@ -836,26 +1461,33 @@ class PDFConverter:
             line_height = 14
             
             c.setFont("Helvetica", 10)
+            space_width = c.stringWidth(" ")
+            max_width = width - 144  # 2 inch margins
             
             for paragraph_text in full_text:
                 if not paragraph_text.strip():
                     y_position -= line_height
                     continue
                     
-                # Word wrap
+                # Word wrap: measure each word once, keep a running line width and
+                # only join the line's words when it is drawn
                 words = paragraph_text.split()
-                current_line = ""
+                line_words = []
+                line_width = 0
                 
                 for word in words:
-                    test_line = current_line + (" " if current_line else "") + word
-                    if c.stringWidth(test_line) < width - 144:  # 2 inch margins
-                        current_line = test_line
+                    word_width = c.stringWidth(word)
+                    test_width = line_width + (space_width if line_words else 0) + word_width
+                    if test_width < max_width:
+                        line_words.append(word)
+                        line_width = test_width
                     else:
-                        if current_line:
-                            c.drawString(72, y_position, current_line)
+                        if line_words:
+                            c.drawString(72, y_position, " ".join(line_words))
                             y_position -= line_height
                             
-                        current_line = word
+                        line_words = [word]
+                        line_width = word_width
                         
                         # Check if we need a new page
                         if y_position < 72:
@@ -864,8 +1496,8 @@ class PDFConverter:
                             c.setFont("Helvetica", 10)
                             
                 # Draw the last line
-                if current_line:
-                    c.drawString(72, y_position, current_line)
+                if line_words:
+                    c.drawString(72, y_position, " ".join(line_words))
                     y_position -= line_height * 1.5  # Extra space between paragraphs
                     
                 # Check if we need a new page
@@ -876,7 +1508,7 @@ class PDFConverter:
                     
             c.save()
             
-            self.log(f"Converted Word document to PDF: {Path(input_path).name}")
+            self.log(f"Converted Word document to PDF: {os.path.basename(input_path)}")
             return True
             
         except Exception as e:
@@ -892,10 +1524,13 @@ class PDFConverter:
         try:
             # Read text file preserving exact line structure
             with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+                text_content = f.read()
                 
-            # Remove only trailing newlines but preserve internal structure
-            lines = [line.rstrip('\n\r') for line in lines]
+            # Universal newlines already turned \r\n and \r into \n; split on \n only so
+            # form feeds and other characters str.splitlines breaks on stay in the line
+            lines = text_content.split('\n')
+            if lines[-1] == '':
+                lines.pop()  # No extra line after the final newline
                 
             # Create PDF with precise line tracking
             c = canvas.Canvas(str(output_path), pagesize=letter)
@@ -910,64 +1545,65 @@ class PDFConverter:
             max_chars_per_line = 80  # Standard text width
             
             c.setFont("Courier", font_size)  # Monospace for text files
-            y_position = height - top_margin
+            page_top = height - top_margin
+            
+            # Every line is a full line height, so a page holds a fixed number of them
+            # (the last one sits on the bottom margin)
+            lines_per_page = int((page_top - bottom_margin) // line_height) + 1
+            lines_on_page = 0
+            
+            # One text object per page: a single BT/ET block, lines advance by leading
+            text_object = self._begin_text_page(c, left_margin, page_top, "Courier", font_size, line_height)
             
-            # Track every line position for perfect alignment
-            line_positions = []
+            # Track every line position for perfect alignment; positions are whole
+            # multiples of half a line height, so float32 storage is exact
+            line_positions = array('f')
             total_lines = 0
             
             for original_line in lines:
                 # Handle empty lines
                 if not original_line.strip():
-                    line_positions.append(y_position)
-                    y_position -= line_height
+                    text_object.moveCursor(0, line_height)
+                    line_positions.append(page_top - lines_on_page * line_height)
+                    lines_on_page += 1
                     total_lines += 1
                     
                     # Check for new page
-                    if y_position < bottom_margin:
+                    if lines_on_page == lines_per_page:
+                        c.drawText(text_object)
                         c.showPage()
-                        y_position = height - top_margin
-                        c.setFont("Courier", font_size)
+                        lines_on_page = 0
+                        text_object = self._begin_text_page(c, left_margin, page_top, "Courier", font_size, line_height)
                     continue
                 
-                # Handle long lines by wrapping but tracking each visual line
-                remaining_text = original_line
-                while remaining_text:
-                    # Extract chunk that fits on one line
-                    if len(remaining_text) <= max_chars_per_line:
-                        line_chunk = remaining_text
-                        remaining_text = ""
-                    else:
-                        # Smart break at word boundary if possible
-                        break_point = max_chars_per_line
-                        if remaining_text[max_chars_per_line] != ' ':
-                            # Look backwards for space
-                            for i in range(max_chars_per_line - 1, max_chars_per_line - 20, -1):
-                                if i > 0 and remaining_text[i] == ' ':
-                                    break_point = i
-                                    break
-                        
-                        line_chunk = remaining_text[:break_point]
-                        remaining_text = remaining_text[break_point:].lstrip()
+                # Handle long lines by wrapping but tracking each visual line; Courier is
+                # fixed-width, so most lines fit by character count and skip wrapping entirely
+                if len(original_line) <= max_chars_per_line:
+                    line_chunks = (original_line,)
+                else:
+                    line_chunks = self._wrap_monospace_line(original_line, max_chars_per_line)
                     
+                for line_chunk in line_chunks:
                     # Draw this line chunk
-                    c.drawString(left_margin, y_position, line_chunk)
-                    line_positions.append(y_position)
-                    y_position -= line_height
+                    text_object.textLine(line_chunk)
+                    line_positions.append(page_top - lines_on_page * line_height)
+                    lines_on_page += 1
                     total_lines += 1
                     
                     # Check for new page
-                    if y_position < bottom_margin:
+                    if lines_on_page == lines_per_page:
+                        c.drawText(text_object)
                         c.showPage()
-                        y_position = height - top_margin
-                        c.setFont("Courier", font_size)
+                        lines_on_page = 0
+                        text_object = self._begin_text_page(c, left_margin, page_top, "Courier", font_size, line_height)
                     
+            c.drawText(text_object)
             c.save()
             
             # Store line mapping metadata for later use
             self._store_line_mapping(output_path, line_positions, total_lines)
             
-            self.log(f"Enhanced text conversion completed: {Path(input_path).name} ({total_lines} lines mapped)")
+            self.log(f"Enhanced text conversion completed: {os.path.basename(input_path)} ({total_lines} lines mapped)")
             return True
             
         except Exception as e:
@@ -975,6 +1611,31 @@ class PDFConverter:
             # Fallback to original method
             return self._convert_text_to_pdf(input_path, output_path)
 
+    def _wrap_monospace_line(self, text, max_chars):
+        """Split a fixed-width line into chunks of at most max_chars characters
+        
+        Breaks at the last space within the final 20 columns when there is one,
+        otherwise hard-breaks at max_chars; leading spaces of each continuation
+        chunk are dropped.
+        
+        Args:
+            text: Line text without its trailing newline
+            max_chars: Maximum characters per visual line
+            
+        Returns:
+            list: Visual line chunks in order
+        """
+        chunks = []
+        while len(text) > max_chars:
+            break_point = text.rfind(' ', max_chars - 19, max_chars + 1)
+            if break_point <= 0:
+                break_point = max_chars
+            chunks.append(text[:break_point])
+            text = text[break_point:].lstrip()
+        if text:
+            chunks.append(text)
+        return chunks
+        
     def _convert_text_to_pdf(self, input_path, output_path):
         """Convert text file to PDF (fallback method)"""
         if not canvas:
@@ -1022,7 +1683,7 @@ class PDFConverter:
                     
             c.save()
             
-            self.log(f"Converted text file to PDF: {Path(input_path).name}")
+            self.log(f"Converted text file to PDF: {os.path.basename(input_path)}")
             return True
             
         except Exception as e:
@@ -1035,242 +1696,99 @@ class PDFConverter:
         # A more sophisticated implementation would parse RTF formatting
         return self._convert_text_to_pdf(input_path, output_path)
     
-    def _convert_word_to_pdf_enhanced(self, input_path, output_path):
-        """Convert Word document to PDF with precise line mapping for 100% accuracy"""
-        if not Document or not canvas:
-            self.log("Required libraries not available for Word conversion")
-            return False
-            
+    def _store_line_mapping(self, pdf_path, line_positions, total_lines):
+        """Store line mapping metadata for enhanced line numbering accuracy
+        
+        The row goes into the output folder's LINEMAP_DB_NAME database on a
+        background thread; load_line_mapping and shutdown wait for any pending
+        write before returning. created is stored as Unix epoch seconds.
+        """
         try:
-            # Read Word document
-            doc = Document(input_path)
-            
-            # Extract paragraphs with enhanced processing
-            paragraphs = []
-            for para in doc.paragraphs:
-                text = para.text.strip()
-                if text:  # Only include non-empty paragraphs
-                    paragraphs.append(text)
-                elif len(paragraphs) > 0:  # Add blank line markers
-                    paragraphs.append("")  # Preserve blank lines
-                    
-            # Create PDF with precise line tracking
-            c = canvas.Canvas(str(output_path), pagesize=letter)
-            width, height = letter
-            
-            # Enhanced settings for consistent line numbering
-            font_size = 10
-            line_height = 12  # Consistent with line numbering system
-            left_margin = 72  # 1 inch
-            right_margin = 72  # 1 inch
-            top_margin = 72   # 1 inch
-            bottom_margin = 72  # 1 inch
-            usable_width = width - left_margin - right_margin
-            
-            c.setFont("Helvetica", font_size)
-            y_position = height - top_margin
-            
-            # Track every line position for perfect alignment
-            line_positions = []
-            total_lines = 0
-            
-            for paragraph_text in paragraphs:
-                if not paragraph_text:  # Empty paragraph = blank line
-                    line_positions.append(y_position)
-                    y_position -= line_height
-                    total_lines += 1
-                    
-                    # Check for new page
-                    if y_position < bottom_margin:
-                        c.showPage()
-                        y_position = height - top_margin
-                        c.setFont("Helvetica", font_size)
-                    continue
-                    
-                # Smart word wrapping with exact line tracking
-                words = paragraph_text.split()
-                current_line = ""
-                
-                for word in words:
-                    test_line = current_line + (" " if current_line else "") + word
-                    
-                    # Check if line fits
-                    if c.stringWidth(test_line, "Helvetica", font_size) <= usable_width:
-                        current_line = test_line
-                    else:
-                        # Current line is full, output it
-                        if current_line:
-                            c.drawString(left_margin, y_position, current_line)
-                            line_positions.append(y_position)
-                            y_position -= line_height
-                            total_lines += 1
-                            
-                            # Check for new page
-                            if y_position < bottom_margin:
-                                c.showPage()
-                                y_position = height - top_margin
-                                c.setFont("Helvetica", font_size)
-                                
-                        current_line = word
-                        
-                # Output the final line of the paragraph
-                if current_line:
-                    c.drawString(left_margin, y_position, current_line)
-                    line_positions.append(y_position)
-                    y_position -= line_height
-                    total_lines += 1
-                    
-                    # Check for new page
-                    if y_position < bottom_margin:
-                        c.showPage()
-                        y_position = height - top_margin
-                        c.setFont("Helvetica", font_size)
-                        
-                # Add space between paragraphs
-                y_position -= line_height * 0.5
-                        
-            c.save()
+            pdf_path_obj = Path(pdf_path)
+            db_path = pdf_path_obj.parent / LINEMAP_DB_NAME
+            
+            # Store line mapping data; positions as packed float32
+            row = (
+                pdf_path_obj.name,
+                total_lines,
+                array('f', line_positions).tobytes(),
+                'enhanced',
+                12,
+                10,
+                time.time()
+            )
             
-            # Store line mapping metadata for later use
-            self._store_line_mapping(output_path, line_positions, total_lines)
+            # Report writes that finished while the previous document was converting
+            self._collect_line_mappings(wait=False)
             
-            self.log(f"Enhanced Word conversion completed: {Path(input_path).name} ({total_lines} lines mapped)")
-            return True
+            if self._metadata_pool is None:
+                self._metadata_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="linemap")
+            self._pending_line_mappings[pdf_path_obj] = self._metadata_pool.submit(
+                _write_line_mapping, self._mapping_dbs, db_path, row)
             
         except Exception as e:
-            self.log(f"Error in enhanced Word conversion: {e}")
-            # Fallback to original method
-            return self._convert_word_to_pdf(input_path, output_path)
-    
-    def _convert_text_to_pdf_enhanced(self, input_path, output_path):
-        """Convert text file to PDF with precise line mapping for 100% accuracy"""
-        if not canvas:
-            self.log("ReportLab not available for text conversion")
-            return False
-            
-        try:
-            # Read text file preserving exact line structure
-            with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                
-            # Remove only trailing newlines but preserve internal structure
-            lines = [line.rstrip('\n\r') for line in lines]
-                
-            # Create PDF with precise line tracking
-            c = canvas.Canvas(str(output_path), pagesize=letter)
-            width, height = letter
-            
-            # Enhanced settings for consistent line numbering
-            font_size = 9
-            line_height = 12  # Consistent with line numbering system
-            left_margin = 72  # 1 inch
-            bottom_margin = 72  # 1 inch
-            top_margin = 72   # 1 inch
-            max_chars_per_line = 80  # Standard text width
-            
-            c.setFont("Courier", font_size)  # Monospace for text files
-            y_position = height - top_margin
-            
-            # Track every line position for perfect alignment
-            line_positions = []
-            total_lines = 0
-            
-            for original_line in lines:
-                # Handle empty lines
-                if not original_line.strip():
-                    line_positions.append(y_position)
-                    y_position -= line_height
-                    total_lines += 1
-                    
-                    # Check for new page
-                    if y_position < bottom_margin:
-                        c.showPage()
-                        y_position = height - top_margin
-                        c.setFont("Courier", font_size)
-                    continue
-                
-                # Handle long lines by wrapping but tracking each visual line
-                remaining_text = original_line
-                while remaining_text:
-                    # Extract chunk that fits on one line
-                    if len(remaining_text) <= max_chars_per_line:
-                        line_chunk = remaining_text
-                        remaining_text = ""
-                    else:
-                        # Smart break at word boundary if possible
-                        break_point = max_chars_per_line
-                        if remaining_text[max_chars_per_line] != ' ':
-                            # Look backwards for space
-                            for i in range(max_chars_per_line - 1, max_chars_per_line - 20, -1):
-                                if i > 0 and remaining_text[i] == ' ':
-                                    break_point = i
-                                    break
-                        
-                        line_chunk = remaining_text[:break_point]
-                        remaining_text = remaining_text[break_point:].lstrip()
-                    
-                    # Draw this line chunk
-                    c.drawString(left_margin, y_position, line_chunk)
-                    line_positions.append(y_position)
-                    y_position -= line_height
-                    total_lines += 1
-                    
-                    # Check for new page
-                    if y_position < bottom_margin:
-                        c.showPage()
-                        y_position = height - top_margin
-                        c.setFont("Courier", font_size)
-                    
-            c.save()
-            
-            # Store line mapping metadata for later use
-            self._store_line_mapping(output_path, line_positions, total_lines)
-            
-            self.log(f"Enhanced text conversion completed: {Path(input_path).name} ({total_lines} lines mapped)")
-            return True
+            self.log(f"Warning: Could not save line mapping metadata: {e}")
+            # Not critical - continue without metadata
             
-        except Exception as e:
-            self.log(f"Error in enhanced text conversion: {e}")
-            # Fallback to original method
-            return self._convert_text_to_pdf(input_path, output_path)
+    def _collect_line_mappings(self, wait=True, pdf_path=None):
+        """
+        Log the outcome of background line mapping writes
         
-    def _store_line_mapping(self, pdf_path, line_positions, total_lines):
-        """Store line mapping metadata for enhanced line numbering accuracy"""
-        try:
-            import json
+        Args:
+            wait: Block until pending writes finish; otherwise only collect finished ones
+            pdf_path: Only collect the write for this PDF (a Path)
+        """
+        if pdf_path is not None:
+            paths = [pdf_path] if pdf_path in self._pending_line_mappings else []
+        else:
+            paths = list(self._pending_line_mappings)
             
-            # Create metadata file path
-            pdf_path_obj = Path(pdf_path)
-            metadata_path = pdf_path_obj.with_suffix('.linemap.json')
+        for path in paths:
+            future = self._pending_line_mappings[path]
+            if not wait and not future.done():
+                continue
+            del self._pending_line_mappings[path]
             
-            # Store line mapping data
-            mapping_data = {
-                'pdf_file': pdf_path_obj.name,
-                'total_lines': total_lines,
-                'line_positions': line_positions,
-                'conversion_type': 'enhanced',
-                'line_height': 12,
-                'font_size': 10,
-                'created_timestamp': str(datetime.now())
-            }
-            
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(mapping_data, f, indent=2)
+            error = future.exception()
+            if error is None:
+                self.log(f"Line mapping metadata saved: {path.name}")
+            else:
+                self.log(f"Warning: Could not save line mapping metadata: {error}")
+                # Not critical - continue without metadata
                 
-            self.log(f"Line mapping metadata saved: {metadata_path.name}")
-            
-        except Exception as e:
-            self.log(f"Warning: Could not save line mapping metadata: {e}")
-            # Not critical - continue without metadata
-            
     def load_line_mapping(self, pdf_path):
         """Load line mapping metadata if available"""
         try:
-            import json
-            
             pdf_path_obj = Path(pdf_path)
-            metadata_path = pdf_path_obj.with_suffix('.linemap.json')
             
+            # Make sure a background write for this file has landed first
+            self._collect_line_mappings(pdf_path=pdf_path_obj)
+            
+            db_path = pdf_path_obj.parent / LINEMAP_DB_NAME
+            if db_path.exists():
+                conn = sqlite3.connect(str(db_path), timeout=30)
+                try:
+                    row = conn.execute(
+                        "SELECT pdf, total_lines, positions, conversion_type, line_height, font_size, created "
+                        "FROM linemaps WHERE pdf = ?", (pdf_path_obj.name,)).fetchone()
+                finally:
+                    conn.close()
+                    
+                if row:
+                    mapping_data = {
+                        'pdf_file': row[0],
+                        'total_lines': row[1],
+                        'line_positions': array('f', row[2]).tolist(),
+                        'conversion_type': row[3],
+                        'line_height': row[4],
+                        'font_size': row[5],
+                        'created_timestamp': row[6]
+                    }
+                    self.log(f"Line mapping metadata loaded: {mapping_data['total_lines']} lines")
+                    return mapping_data
+                    
+            # Older outputs have a per-PDF JSON sidecar instead
+            metadata_path = pdf_path_obj.with_suffix('.linemap.json')
             if metadata_path.exists():
                 with open(metadata_path, 'r', encoding='utf-8') as f:
                     mapping_data = json.load(f)
@@ -1283,6 +1801,14 @@ class PDFConverter:
         except Exception as e:
             self.log(f"Warning: Could not load line mapping metadata: {e}")
             return None
+            
+    def shutdown(self):
+        """Wait for pending line mapping writes, close their databases and stop the metadata thread"""
+        self._collect_line_mappings()
+        if self._metadata_pool is not None:
+            self._metadata_pool.submit(_close_linemap_dbs, self._mapping_dbs).result()
+            self._metadata_pool.shutdown(wait=True)
+            self._metadata_pool = None
 
     def get_conversion_errors(self):
         """Get list of conversion errors"""
@@ -7,8 +7,7 @@ Handles intelligent orientation detection for PDF documents using:
 """
 
 import fitz  # PyMuPDF
-from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, NamedTuple
 import tempfile
 import os
 import shutil
@@ -16,6 +15,266 @@ import config
 from PIL import Image
 import pytesseract
 import io
+import hashlib
+import sqlite3
+import time
+from array import array
+import numpy as np
+from collections import OrderedDict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat, islice
+
+try:
+    from .error_handling import PoolUnavailableError, map_in_process_pool
+except ImportError:
+    from error_handling import PoolUnavailableError, map_in_process_pool
+
+# Optional numba import for the JIT-compiled text-box reductions
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Tesseract OSD orientation confidence above which its suggested rotation is applied
+OSD_MIN_CONFIDENCE = 2.0
+
+# Pages are rendered for OSD in grayscale at this resolution, with the longer
+# edge capped in pixels since orientation accuracy plateaus beyond it
+OSD_RENDER_DPI = 150
+OSD_MAX_IMAGE_EDGE = 2000
+
+# Image format pytesseract hands the probe to Tesseract in; grayscale PPM is
+# written as an uncompressed PGM, which is far cheaper to encode than PNG
+OSD_IMAGE_FORMAT = "PPM"
+
+# OSD results are remembered per rendered page (by content hash) so reprocessed
+# or duplicated pages skip Tesseract; least recently used entries are evicted
+OSD_CACHE_MAX_ENTRIES = 256
+
+# Detection outcomes are remembered in an SQLite file in the output folder, so
+# re-runs over the same sources skip analysis and OCR. Sources are identified by
+# size, modification time and a hash of their first DETECTION_CACHE_HEAD_BYTES
+DETECTION_CACHE_DB_NAME = "_orientation_cache.sqlite"
+DETECTION_CACHE_HEAD_BYTES = 1 << 20
+_DETECTION_CACHE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS orientations ("
+    "size INTEGER, mtime_ns INTEGER, head BLOB, full_scan_threshold INTEGER, "
+    "rotations BLOB, created REAL, "
+    "PRIMARY KEY (size, mtime_ns, head, full_scan_threshold))"
+)
+
+# Vertical spans settle 90° vs 270° by a left/right side vote once at least
+# BBOX_VOTE_MIN_SPANS of them agree this strongly; otherwise the first one decides
+BBOX_VOTE_MIN_SPANS = 5
+BBOX_VOTE_MAJORITY = 0.8
+
+# Weights of the 90° vs 270° strategies in _determine_90_vs_270_rotation when
+# the vertical spans give no decisive side vote; the writing direction of the
+# text lines is direct evidence, so it counts double
+ROTATION_VOTE_WEIGHTS = {'bbox': 1, 'flow': 2, 'position': 1}
+
+# Orientation ratios settle long before the end of a span-heavy page (large
+# tables), so page analysis looks at no more than this many spans, in page order
+MAX_ANALYZED_SPANS = 200
+
+# Text extraction flags for the native page analysis, which only reads text
+# geometry: keep clipping to the page, but skip image blocks (and decoding their
+# pixels), ligature and whitespace preservation
+TEXT_GEOMETRY_FLAGS = fitz.TEXT_MEDIABOX_CLIP
+
+# Native page analysis is spread over processes only for long documents, with at
+# least this many pages per worker so process start-up is worth paying
+PARALLEL_PAGE_ANALYSIS_MIN_PAGES = 50
+MAX_PAGE_ANALYSIS_WORKERS = 4
+
+
+def _count_horizontal_boxes(widths: np.ndarray, heights: np.ndarray) -> int:
+    """
+    Count text boxes that are wider than they are tall
+
+    Args:
+        widths: (N,) float64 box widths
+        heights: (N,) float64 box heights
+
+    Returns:
+        int: Number of horizontal boxes
+    """
+    return int(np.count_nonzero(widths > heights))
+
+
+if njit is not None:
+    @njit("int64(float64[:], float64[:])", cache=True, fastmath=True)
+    def _count_horizontal_boxes(widths, heights):  # noqa: F811
+        horizontal = 0
+        for i in range(widths.shape[0]):
+            if widths[i] > heights[i]:
+                horizontal += 1
+        return horizontal
+
+
+def _span_geometry(boxes: np.ndarray, page_width: float, page_height: float):
+    """
+    Classify span boxes and normalize their centers to the page
+
+    Args:
+        boxes: (N, 4) float64 array of x0, y0, x1, y1 span boxes
+        page_width: Page width used to normalize x
+        page_height: Page height used to normalize y
+
+    Returns:
+        Tuple: (vertical count, normalized x centers, normalized y centers, upright mask)
+    """
+    x0, y0, x1, y1 = boxes.T
+    widths = x1 - x0
+    heights = y1 - y0
+
+    # If a span is much taller than wide, it's vertical text
+    vertical_count = int(np.count_nonzero(heights > widths * 1.5))
+    return (vertical_count, (x0 + x1) / 2 / page_width,
+            (y0 + y1) / 2 / page_height, heights > widths)
+
+
+if njit is not None:
+    @njit("Tuple((int64, float64[:], float64[:], boolean[:]))(float64[:, :], float64, float64)",
+          cache=True, fastmath=True)
+    def _span_geometry(boxes, page_width, page_height):  # noqa: F811
+        n = boxes.shape[0]
+        x_norm = np.empty(n)
+        y_norm = np.empty(n)
+        upright = np.empty(n, dtype=np.bool_)
+        vertical_count = 0
+        for i in range(n):
+            width = boxes[i, 2] - boxes[i, 0]
+            height = boxes[i, 3] - boxes[i, 1]
+            if height > width * 1.5:
+                vertical_count += 1
+            upright[i] = height > width
+            x_norm[i] = (boxes[i, 0] + boxes[i, 2]) / 2 / page_width
+            y_norm[i] = (boxes[i, 1] + boxes[i, 3]) / 2 / page_height
+        return vertical_count, x_norm, y_norm, upright
+
+
+class SpanStats(NamedTuple):
+    """Per-page span aggregates shared by the text-direction analyzers"""
+    horizontal_count: int  # spans not clearly taller than wide
+    vertical_count: int  # spans more than 1.5x taller than wide
+    x_norm: np.ndarray  # span center x as a fraction of page width
+    y_norm: np.ndarray  # span center y as a fraction of page height (0 = top)
+    upright: np.ndarray  # True where a span is taller than wide
+    dir_y: np.ndarray  # sine of each span's line writing direction (-1 = bottom-to-top)
+
+
+def _collect_span_stats(text_dict, page_rect) -> SpanStats:
+    """
+    Walk a page's text dictionary once, gathering everything the text-direction
+    analyzers need
+
+    Span boxes are packed into one array so the per-span geometry is computed
+    with vector operations. Only the first MAX_ANALYZED_SPANS spans are used -
+    a statistical sample of very dense pages.
+
+    Args:
+        text_dict: page.get_text("dict") output
+        page_rect: Page rectangle used to normalize span centers
+
+    Returns:
+        SpanStats: Direction counts and normalized span positions
+    """
+    spans = list(islice(((span['bbox'], line.get('dir', (1.0, 0.0))[1])
+                         for block in text_dict['blocks'] if 'lines' in block
+                         for line in block['lines'] if 'spans' in line
+                         for span in line['spans'] if 'bbox' in span), MAX_ANALYZED_SPANS))
+    boxes = np.array([bbox for bbox, _ in spans], dtype=float).reshape(-1, 4)
+    vertical_count, x_norm, y_norm, upright = _span_geometry(
+        boxes, float(page_rect.width), float(page_rect.height))
+
+    return SpanStats(
+        horizontal_count=len(boxes) - vertical_count,
+        vertical_count=vertical_count,
+        x_norm=x_norm,
+        y_norm=y_norm,
+        upright=upright,
+        dir_y=np.array([dir_y for _, dir_y in spans], dtype=float),
+    )
+
+
+def _source_fingerprint(path: str) -> Tuple[int, int, bytes]:
+    """
+    Identify a source file for the detection cache without reading all of it
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Tuple[int, int, bytes]: (size, mtime in ns, BLAKE2b digest of the first
+        DETECTION_CACHE_HEAD_BYTES)
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        head = f.read(DETECTION_CACHE_HEAD_BYTES)
+    return stat.st_size, stat.st_mtime_ns, hashlib.blake2b(head, digest_size=16).digest()
+
+
+def _open_detection_cache(db_path: str):
+    """Open (creating if needed) an output folder's orientation cache database"""
+    conn = sqlite3.connect(db_path, isolation_level=None, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(_DETECTION_CACHE_SCHEMA)
+    return conn
+
+
+def _analyze_pages_worker(input_pdf_path: str, start: int, stop: int):
+    """
+    Analyze pages [start, stop) of a PDF inside a process pool worker
+
+    Args:
+        input_pdf_path: Path to input PDF
+        start: First zero-based page index
+        stop: One past the last page index
+
+    Returns:
+        Tuple[list, list]: (page_num, current_rotation, suggested_rotation) per
+        page, and the log messages produced while analyzing them
+    """
+    messages = []
+    detector = PDFOrientationDetector(log_callback=messages.append)
+    doc = fitz.open(input_pdf_path)
+    try:
+        results = [(page_num, *detector._analyze_page(doc[page_num], page_num))
+                   for page_num in range(start, stop)]
+    finally:
+        doc.close()
+    return results, messages
+
+
+def _detect_one(input_pdf_path: str, output_pdf_path: str, tesseract_cmd: str):
+    """
+    Detect and correct one PDF's orientation inside a batch worker process
+
+    Tesseract is limited to a single OpenMP thread since the batch already
+    runs one process per core, and per-page analysis stays sequential for
+    the same reason.
+
+    Args:
+        input_pdf_path: Path to input PDF
+        output_pdf_path: Path for output PDF
+        tesseract_cmd: Tesseract executable configured in the parent
+
+    Returns:
+        Tuple[bool, list]: (detect_and_correct_orientation result, log messages)
+    """
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    if tesseract_cmd and pytesseract.pytesseract.tesseract_cmd != tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+    messages = []
+    detector = PDFOrientationDetector(log_callback=messages.append)
+    detector.parallel_page_analysis = False
+    result = detector.detect_and_correct_orientation(input_pdf_path, output_pdf_path)
+    return result, messages
 
 
 class PDFOrientationDetector:
@@ -27,6 +286,10 @@ class PDFOrientationDetector:
     2. OCR text analysis as fallback for scanned documents
     """
 
+    # Rendered-page hash -> (rotate, orientation_conf), shared by all detectors
+    _osd_cache = OrderedDict()
+    _osd_cache_lock = threading.Lock()
+
     def __init__(self, log_callback=None):
         """
         Initialize the orientation detector
@@ -35,6 +298,12 @@ class PDFOrientationDetector:
             log_callback: Optional callback function for logging messages
         """
         self.log_callback = log_callback
+        # Long documents are analyzed in a process pool unless disabled
+        # (batch workers turn it off - they already run one file per core)
+        self.parallel_page_analysis = True
+        # Documents longer than this whose pages all carry the same rotation are
+        # judged from this many leading pages when those pages agree on a correction
+        self.full_scan_threshold = 3
 
     def log(self, message: str):
         """Log a message using the callback or print"""
@@ -43,6 +312,38 @@ class PDFOrientationDetector:
         else:
             print(message)
 
+    def detect_and_correct_batch(self, pairs, max_workers: Optional[int] = None) -> list:
+        """
+        Detect and correct the orientation of many PDFs, one file per worker process
+
+        Args:
+            pairs: Iterable of (input_pdf_path, output_pdf_path)
+            max_workers: Worker processes (defaults to the CPU count)
+
+        Returns:
+            list: detect_and_correct_orientation results, in the order of pairs
+        """
+        pairs = [(str(input_pdf_path), str(output_pdf_path)) for input_pdf_path, output_pdf_path in pairs]
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+
+        if max_workers > 1:
+            input_paths, output_paths = zip(*pairs)
+            try:
+                outcomes = map_in_process_pool(_detect_one, input_paths, output_paths,
+                                               repeat(pytesseract.pytesseract.tesseract_cmd),
+                                               max_workers=max_workers)
+                results = []
+                for result, messages in outcomes:
+                    for message in messages:
+                        self.log(message)
+                    results.append(result)
+                return results
+            except PoolUnavailableError as e:
+                self.log(f"⚠️  Parallel orientation detection unavailable ({e}) - processing sequentially")
+
+        return [self.detect_and_correct_orientation(input_pdf_path, output_pdf_path)
+                for input_pdf_path, output_pdf_path in pairs]
+
     def detect_and_correct_orientation(self, input_pdf_path: str, output_pdf_path: str) -> bool:
         """
         Detect and correct PDF orientation using advanced methods
@@ -54,102 +355,286 @@ class PDFOrientationDetector:
         Returns:
             bool: True if orientation correction was applied, False if no correction needed
         """
+        doc = None
         try:
-            self.log(f"🔍 Starting advanced orientation detection for: {Path(input_pdf_path).name}")
-
-            # First, try PyMuPDF-based detection for native PDFs
-            correction_applied = self._try_pymupdf_detection(input_pdf_path, output_pdf_path)
-
-            if correction_applied:
-                self.log(f"✅ PyMuPDF orientation correction applied")
+            self.log(f"🔍 Starting advanced orientation detection for: {os.path.basename(input_pdf_path)}")
+
+            # The same source was handled by an earlier run - reuse its outcome
+            cache_key = self._detection_cache_key(input_pdf_path)
+            cached = self._lookup_detection(cache_key, output_pdf_path)
+            if cached is not None:
+                corrected, corrected_rotations = cached
+                self.log(f"♻️  Unchanged since an earlier run - reusing its orientation result")
+                if not corrected:
+                    shutil.copyfile(input_pdf_path, output_pdf_path)
+                    return False
+                doc = fitz.open(input_pdf_path)
+                for page, rotation in zip(doc, corrected_rotations):
+                    page.set_rotation(rotation)
+                self._save_corrected_pdf(doc, output_pdf_path)
                 return True
 
-            # If PyMuPDF detection failed, try OCR-based detection
-            self.log(f"⚠️  PyMuPDF detection failed, trying OCR-based detection")
-            correction_applied = self._try_ocr_detection(input_pdf_path, output_pdf_path)
-
-            if correction_applied:
-                self.log(f"✅ OCR-based orientation correction applied")
-                return True
-
-            # If both methods failed, try aggressive rotation correction for obvious issues
-            self.log(f"⚠️  OCR detection failed, trying aggressive rotation correction")
-            correction_applied = self._try_aggressive_correction(input_pdf_path, output_pdf_path)
-
-            if correction_applied:
-                self.log(f"✅ Aggressive rotation correction applied")
-                return True
+            # Open the PDF once and hand it to every strategy
+            doc = fitz.open(input_pdf_path)
+            correction_applied = self._run_detection_strategies(doc, input_pdf_path, output_pdf_path)
 
-            # If all methods failed, just copy the original
-            self.log(f"ℹ️  No orientation correction needed, using original")
-            shutil.copy2(input_pdf_path, output_pdf_path)
-            return False
+            self._store_detection(cache_key, output_pdf_path,
+                                  [page.rotation for page in doc] if correction_applied else None)
+            return correction_applied
 
         except Exception as e:
             self.log(f"❌ Orientation detection failed: {str(e)}")
             # Fallback: copy original file
             try:
-                shutil.copy2(input_pdf_path, output_pdf_path)
+                shutil.copyfile(input_pdf_path, output_pdf_path)
             except:
                 pass
             return False
+        finally:
+            if doc is not None:
+                doc.close()
+
+    def _detection_cache_key(self, input_pdf_path: str):
+        """Return the detection cache key for a source PDF, or None if it cannot be read"""
+        try:
+            return (*_source_fingerprint(input_pdf_path), self.full_scan_threshold)
+        except OSError as e:
+            self.log(f"   Orientation cache unavailable: {str(e)}")
+            return None
 
-    def _try_pymupdf_detection(self, input_pdf_path: str, output_pdf_path: str) -> bool:
+    def _lookup_detection(self, cache_key, output_pdf_path: str):
         """
-        Try to detect orientation using PyMuPDF page analysis
+        Look up an earlier run's outcome in the output folder's orientation cache
 
         Args:
-            input_pdf_path: Path to input PDF
-            output_pdf_path: Path for output PDF
+            cache_key: Key from _detection_cache_key (None skips the lookup)
+            output_pdf_path: Output path, whose folder holds the cache
 
         Returns:
-            bool: True if correction was applied, False otherwise
+            Optional[Tuple[bool, list]]: (correction applied, corrected page
+            rotations), or None when the source has not been seen
         """
+        db_path = os.path.join(os.path.dirname(os.path.abspath(output_pdf_path)), DETECTION_CACHE_DB_NAME)
+        if cache_key is None or not os.path.exists(db_path):
+            return None
         try:
-            doc = fitz.open(input_pdf_path)
-            if len(doc) == 0:
-                doc.close()
-                return False
+            conn = sqlite3.connect(db_path, timeout=30)
+            try:
+                row = conn.execute(
+                    "SELECT rotations FROM orientations WHERE size = ? AND mtime_ns = ? "
+                    "AND head = ? AND full_scan_threshold = ?", cache_key).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self.log(f"   Orientation cache unavailable: {str(e)}")
+            return None
 
-            # Analyze each page to determine if rotation is needed
-            corrections_needed = []
+        if row is None:
+            return None
+        if row[0] is None:
+            return False, []
+        return True, array('h', row[0]).tolist()
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
+    def _store_detection(self, cache_key, output_pdf_path: str, corrected_rotations: Optional[list]):
+        """
+        Record a detection outcome in the output folder's orientation cache
 
-                # Get page dimensions
-                page_rect = page.rect
-                width = page_rect.width
-                height = page_rect.height
+        Args:
+            cache_key: Key from _detection_cache_key (None skips the write)
+            output_pdf_path: Output path, whose folder holds the cache
+            corrected_rotations: Page rotations after correction, or None if none was needed
+        """
+        if cache_key is None:
+            return
+        db_path = os.path.join(os.path.dirname(os.path.abspath(output_pdf_path)), DETECTION_CACHE_DB_NAME)
+        rotations = None if corrected_rotations is None else array('h', corrected_rotations).tobytes()
+        try:
+            conn = _open_detection_cache(db_path)
+            try:
+                conn.execute("INSERT OR REPLACE INTO orientations VALUES (?, ?, ?, ?, ?, ?)",
+                             (*cache_key, rotations, time.time()))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self.log(f"   Could not save orientation cache entry: {str(e)}")
+
+    def _run_detection_strategies(self, doc, input_pdf_path: str, output_pdf_path: str) -> bool:
+        """
+        Try each orientation strategy in turn, writing output_pdf_path either way
+
+        Args:
+            doc: Open PyMuPDF document
+            input_pdf_path: Path to input PDF file
+            output_pdf_path: Path for output PDF file with corrected orientation
 
-                # Check if page is likely landscape (wider than tall)
-                is_landscape = width > height
+        Returns:
+            bool: True if orientation correction was applied, False if no correction needed
+        """
+        # First, try PyMuPDF-based detection for native PDFs
+        correction_applied = self._try_pymupdf_detection(doc, input_pdf_path, output_pdf_path)
 
-                # Get current rotation
-                current_rotation = page.rotation
+        if correction_applied:
+            self.log(f"✅ PyMuPDF orientation correction applied")
+            return True
 
-                self.log(f"   Page {page_num + 1}: {width:.0f}x{height:.0f}, rotation: {current_rotation}°, landscape: {is_landscape}")
+        # If PyMuPDF detection failed, try OCR-based detection
+        self.log(f"⚠️  PyMuPDF detection failed, trying OCR-based detection")
+        correction_applied = self._try_ocr_detection(doc, output_pdf_path)
 
-                # For native PDFs, we need to analyze text content to determine correct orientation
-                suggested_rotation = self._analyze_page_text_orientation(page)
+        if correction_applied:
+            self.log(f"✅ OCR-based orientation correction applied")
+            return True
 
-                if suggested_rotation != current_rotation:
-                    corrections_needed.append((page_num, suggested_rotation))
-                    self.log(f"   → Page {page_num + 1}: needs rotation from {current_rotation}° to {suggested_rotation}°")
+        # If both methods failed, try aggressive rotation correction for obvious issues
+        self.log(f"⚠️  OCR detection failed, trying aggressive rotation correction")
+        correction_applied = self._try_aggressive_correction(doc, output_pdf_path)
 
-            doc.close()
+        if correction_applied:
+            self.log(f"✅ Aggressive rotation correction applied")
+            return True
+
+        # If all methods failed, just copy the original (contents only - the output
+        # is a new derived file, and copyfile lets the kernel move the bytes)
+        self.log(f"ℹ️  No orientation correction needed, using original")
+        shutil.copyfile(input_pdf_path, output_pdf_path)
+        return False
 
-            # Apply corrections if needed
-            if corrections_needed:
-                self.log(f"📝 Applying {len(corrections_needed)} orientation corrections using PyMuPDF")
-                return self._apply_pymupdf_corrections(input_pdf_path, output_pdf_path, corrections_needed)
+    def _try_pymupdf_detection(self, doc, input_pdf_path: str, output_pdf_path: str) -> bool:
+        """
+        Try to detect orientation using PyMuPDF page analysis
+
+        Args:
+            doc: Open PyMuPDF document
+            input_pdf_path: Path to input PDF (reopened by parallel workers)
+            output_pdf_path: Path for output PDF
+
+        Returns:
+            bool: True if correction was applied, False otherwise
+        """
+        original_rotations = []
+        try:
+            page_count = len(doc)
+            if page_count == 0:
+                return False
+
+            original_rotations = [page.rotation for page in doc]
+
+            # A uniformly rotated document is usually rotated the same way throughout, so
+            # its leading pages are analyzed first and, if they agree on a correction,
+            # speak for the rest. Pages that need none say nothing about later pages,
+            # which may still hold sideways content, so those are analyzed in full.
+            page_results = []
+            sample_size = self.full_scan_threshold
+            if page_count > sample_size and len(set(original_rotations)) == 1:
+                page_results = [(page_num, *self._analyze_page(doc[page_num], page_num))
+                                for page_num in range(sample_size)]
+                suggestions = {suggested_rotation for _, _, suggested_rotation in page_results}
+                if len(suggestions) == 1 and suggestions != {original_rotations[0]}:
+                    suggested_rotation = suggestions.pop()
+                    self.log(f"   Pages 1-{sample_size} agree on {suggested_rotation}° - assuming the same for all {page_count} pages")
+                    page_results.extend((page_num, original_rotations[page_num], suggested_rotation)
+                                        for page_num in range(sample_size, page_count))
+                else:
+                    self.log(f"   Pages 1-{sample_size} need no common correction - analyzing every page")
+
+            # Analyze each remaining page to determine if rotation is needed
+            start = len(page_results)
+            if start < page_count:
+                workers = min(os.cpu_count() or 1, MAX_PAGE_ANALYSIS_WORKERS,
+                              (page_count - start) // PARALLEL_PAGE_ANALYSIS_MIN_PAGES)
+                remaining_results = None
+                if workers > 1 and self.parallel_page_analysis:
+                    remaining_results = self._analyze_pages_parallel(input_pdf_path, start, page_count, workers)
+
+                if remaining_results is None:
+                    remaining_results = [(page_num, *self._analyze_page(doc[page_num], page_num))
+                                         for page_num in range(start, page_count)]
+                page_results.extend(remaining_results)
+
+            # Apply corrections directly to the open document
+            corrections_applied = 0
+            for page_num, current_rotation, suggested_rotation in page_results:
+                if suggested_rotation != current_rotation:
+                    doc[page_num].set_rotation(suggested_rotation)
+                    corrections_applied += 1
+
+            if corrections_applied:
+                self.log(f"📝 Applying {corrections_applied} orientation corrections using PyMuPDF")
+                self._save_corrected_pdf(doc, output_pdf_path)
+                self.log(f"✅ PyMuPDF corrections applied successfully")
+                return True
 
             return False
 
         except Exception as e:
             self.log(f"   PyMuPDF detection failed: {str(e)}")
+            self._restore_rotations(doc, original_rotations)
             return False
 
+    def _analyze_page(self, page, page_num: int) -> Tuple[int, int]:
+        """
+        Log a page's geometry and work out the rotation it should have
+
+        Args:
+            page: PyMuPDF page object
+            page_num: Zero-based page index (for logging)
+
+        Returns:
+            Tuple[int, int]: (current_rotation, suggested_rotation)
+        """
+        # Get page dimensions
+        page_rect = page.rect
+        width = page_rect.width
+        height = page_rect.height
+
+        # Check if page is likely landscape (wider than tall)
+        is_landscape = width > height
+
+        # Get current rotation
+        current_rotation = page.rotation
+
+        self.log(f"   Page {page_num + 1}: {width:.0f}x{height:.0f}, rotation: {current_rotation}°, landscape: {is_landscape}")
+
+        # For native PDFs, we need to analyze text content to determine correct orientation
+        suggested_rotation = self._analyze_page_text_orientation(page)
+
+        if suggested_rotation != current_rotation:
+            self.log(f"   → Page {page_num + 1}: needs rotation from {current_rotation}° to {suggested_rotation}°")
+
+        return current_rotation, suggested_rotation
+
+    def _analyze_pages_parallel(self, input_pdf_path: str, start: int, stop: int, workers: int):
+        """
+        Analyze contiguous page ranges in a process pool
+
+        Each worker opens the PDF once for its range; their log messages are
+        relayed here in page order so the log reads as if run sequentially.
+
+        Args:
+            input_pdf_path: Path to input PDF
+            start: First zero-based page index to analyze
+            stop: One past the last page index to analyze
+            workers: Number of worker processes
+
+        Returns:
+            list: (page_num, current_rotation, suggested_rotation) per page, or
+            None if the pool could not be used
+        """
+        bounds = [start + (stop - start) * i // workers for i in range(workers + 1)]
+        try:
+            chunks = map_in_process_pool(_analyze_pages_worker, repeat(input_pdf_path),
+                                         bounds[:-1], bounds[1:], max_workers=workers)
+        except PoolUnavailableError as e:
+            self.log(f"   ⚠️  Parallel page analysis unavailable ({e}) - analyzing sequentially")
+            return None
+
+        page_results = []
+        for results, messages in chunks:
+            for message in messages:
+                self.log(message)
+            page_results.extend(results)
+        return page_results
+
     def _analyze_page_text_orientation(self, page) -> int:
         """
         Analyze text content to determine correct orientation
@@ -165,93 +650,93 @@ class PDFOrientationDetector:
         try:
             current_rotation = page.rotation
 
+            # The span dictionary is extracted once and shared by both analyses below
+            try:
+                text_dict = page.get_text("dict", flags=TEXT_GEOMETRY_FLAGS)
+            except Exception as e:
+                self.log(f"      Dict extraction failed: {str(e)}")
+                text_dict = None
+
             # ENHANCED: Try multiple text extraction methods
-            text_data = self._extract_text_data_multiple_methods(page)
+            widths, heights = self._extract_text_data_multiple_methods(page, text_dict)
 
-            if not text_data:
+            if not widths.size:
                 # No text found, can't determine orientation - keep current
                 self.log(f"      No text content found, keeping current rotation {current_rotation}°")
                 return current_rotation
 
             # NEW: Analyze text direction for content-level rotation detection
-            text_direction_result = self._analyze_text_direction_for_rotation(page)
+            text_direction_result = self._analyze_text_direction_for_rotation(page, text_dict)
             if text_direction_result != current_rotation:
                 self.log(f"      Text direction analysis suggests rotation: {text_direction_result}°")
                 return text_direction_result
 
             # Use improved heuristics as fallback
-            return self._determine_orientation_conservative(text_data, page.rect, current_rotation)
+            return self._determine_orientation_conservative(widths, heights, page.rect, current_rotation)
 
         except Exception as e:
             self.log(f"      Text analysis failed: {str(e)}")
             return page.rotation
 
-    def _extract_text_data_multiple_methods(self, page):
+    def _extract_text_data_multiple_methods(self, page, text_dict=None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Enhanced text extraction using multiple methods for better compatibility
+
+        Args:
+            page: PyMuPDF page object
+            text_dict: Already extracted page.get_text("dict") output, if any
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Widths and heights of the non-empty text boxes
         """
-        text_data = []
+        widths = []
+        heights = []
 
         # Method 1: Dict extraction (most reliable for structured text)
         try:
-            text_dict = page.get_text("dict")
+            if text_dict is None:
+                text_dict = page.get_text("dict", flags=TEXT_GEOMETRY_FLAGS)
             if text_dict and 'blocks' in text_dict:
-                for block in text_dict['blocks']:
-                    if 'lines' in block:
-                        for line in block['lines']:
-                            if 'spans' in line:
-                                for span in line['spans']:
-                                    if 'text' in span and span['text'].strip():
-                                        x0, y0 = span['bbox'][0], span['bbox'][1]
-                                        x1, y1 = span['bbox'][2], span['bbox'][3]
-                                        text_data.append({
-                                            'text': span['text'],
-                                            'x0': x0, 'y0': y0, 'x1': x1, 'y1': y1,
-                                            'width': x1 - x0,
-                                            'height': y1 - y0
-                                        })
+                text_spans = (span
+                              for block in text_dict['blocks'] if 'lines' in block
+                              for line in block['lines'] if 'spans' in line
+                              for span in line['spans'] if 'text' in span and span['text'].strip())
+                # Sample at most MAX_ANALYZED_SPANS spans on dense pages
+                for span in islice(text_spans, MAX_ANALYZED_SPANS):
+                    x0, y0, x1, y1 = span['bbox']
+                    widths.append(x1 - x0)
+                    heights.append(y1 - y0)
         except Exception as e:
             self.log(f"      Dict extraction failed: {str(e)}")
 
         # Method 2: Raw text extraction with position analysis
-        if not text_data:
+        if not widths:
             try:
-                blocks = page.get_text("blocks")
+                blocks = page.get_text("blocks", flags=TEXT_GEOMETRY_FLAGS)
                 for block in blocks:
                     if len(block) >= 4:  # x0, y0, x1, y1, text, ...
                         x0, y0, x1, y1, text = block[:5]
                         if text.strip():
-                            text_data.append({
-                                'text': text,
-                                'x0': x0, 'y0': y0, 'x1': x1, 'y1': y1,
-                                'width': x1 - x0,
-                                'height': y1 - y0
-                            })
+                            widths.append(x1 - x0)
+                            heights.append(y1 - y0)
             except Exception as e:
                 self.log(f"      Block extraction failed: {str(e)}")
 
         # Method 3: Simple text extraction as fallback
-        if not text_data:
+        if not widths:
             try:
                 text = page.get_text()
                 if text.strip():
-                    # For simple text, create a single block covering most of the page
+                    # For simple text, use a single box covering most of the page
                     page_rect = page.rect
-                    text_data.append({
-                        'text': text[:100],  # Limit text length
-                        'x0': page_rect.x0 + 50,
-                        'y0': page_rect.y0 + 50,
-                        'x1': page_rect.x1 - 50,
-                        'y1': page_rect.y1 - 50,
-                        'width': page_rect.width - 100,
-                        'height': page_rect.height - 100
-                    })
+                    widths.append(page_rect.width - 100)
+                    heights.append(page_rect.height - 100)
             except Exception as e:
                 self.log(f"      Simple extraction failed: {str(e)}")
 
-        return text_data
+        return np.array(widths, dtype=float), np.array(heights, dtype=float)
 
-    def _analyze_text_direction_for_rotation(self, page) -> int:
+    def _analyze_text_direction_for_rotation(self, page, text_dict=None) -> int:
         """
         Analyze text direction to detect content-level rotation (when page rotation = 0° but text is rotated)
 
@@ -261,6 +746,7 @@ class PDFOrientationDetector:
 
         Args:
             page: PyMuPDF page object
+            text_dict: Already extracted page.get_text("dict") output, if any
 
         Returns:
             int: Suggested rotation angle based on text direction analysis
@@ -269,49 +755,21 @@ class PDFOrientationDetector:
             current_rotation = page.rotation
 
             # Get text blocks with direction analysis
-            text_dict = page.get_text("dict")
+            if text_dict is None:
+                text_dict = page.get_text("dict", flags=TEXT_GEOMETRY_FLAGS)
             if not text_dict or 'blocks' not in text_dict:
                 return current_rotation
 
-            # Analyze text direction across all blocks
-            total_horizontal_lines = 0
-            total_vertical_lines = 0
-            total_blocks = 0
-
-            for block in text_dict['blocks']:
-                if 'lines' in block:
-                    horizontal_lines = 0
-                    vertical_lines = 0
-
-                    for line in block['lines']:
-                        if 'spans' in line:
-                            # Analyze line direction based on bbox aspect ratio
-                            for span in line['spans']:
-                                if 'bbox' in span:
-                                    x0, y0, x1, y1 = span['bbox']
-                                    width = x1 - x0
-                                    height = y1 - y0
-
-                                    # If line is much taller than wide, it's vertical text
-                                    if height > width * 1.5:  # Height is 1.5x+ the width
-                                        vertical_lines += 1
-                                    else:
-                                        horizontal_lines += 1
-
-                    total_horizontal_lines += horizontal_lines
-                    total_vertical_lines += vertical_lines
-                    total_blocks += 1
-
-            if total_blocks == 0:
-                return current_rotation
+            # Analyze text direction across all spans in a single pass
+            stats = _collect_span_stats(text_dict, page.rect)
 
             # Calculate ratios
-            total_lines = total_horizontal_lines + total_vertical_lines
+            total_lines = stats.horizontal_count + stats.vertical_count
             if total_lines == 0:
                 return current_rotation
 
-            vertical_ratio = total_vertical_lines / total_lines
-            horizontal_ratio = total_horizontal_lines / total_lines
+            vertical_ratio = stats.vertical_count / total_lines
+            horizontal_ratio = stats.horizontal_count / total_lines
 
             self.log(f"      Text direction analysis: {horizontal_ratio:.1f} horizontal, {vertical_ratio:.1f} vertical ({total_lines} lines)")
 
@@ -320,7 +778,7 @@ class PDFOrientationDetector:
                 # Case 1: Mostly vertical text with 0° page rotation = content is rotated 90° or 270°
                 if vertical_ratio > 0.7:  # 70%+ vertical text
                     # ENHANCED: Better distinction between 90° and 270° based on text positioning
-                    suggested_rotation = self._determine_90_vs_270_rotation(page, text_dict)
+                    suggested_rotation = self._determine_90_vs_270_rotation(stats)
                     self.log(f"      Content rotation detected: 0° page + vertical text → suggest {suggested_rotation}° rotation")
                     return suggested_rotation
 
@@ -328,21 +786,9 @@ class PDFOrientationDetector:
                 elif horizontal_ratio > 0.7:  # 70%+ horizontal text
                     # For 180° content rotation, we need to check if text appears in expected reading position
                     # If horizontal text is positioned unusually (e.g., at bottom of page), it might be 180° rotated
-                    text_positions = []
-                    for block in text_dict['blocks']:
-                        if 'lines' in block:
-                            for line in block['lines']:
-                                if 'spans' in line:
-                                    for span in line['spans']:
-                                        if 'bbox' in span:
-                                            bbox = span['bbox']
-                                            # Normalize Y position (0 = top, 1 = bottom)
-                                            y_center = (bbox[1] + bbox[3]) / 2
-                                            y_normalized = y_center / page.rect.height
-                                            text_positions.append(y_normalized)
-
-                    if text_positions:
-                        avg_y_position = sum(text_positions) / len(text_positions)
+                    # (normalized Y: 0 = top, 1 = bottom)
+                    if stats.y_norm.size:
+                        avg_y_position = stats.y_norm.mean()
                         # If text is mostly in bottom half of page (> 0.6), it might be 180° rotated
                         if avg_y_position > 0.6:
                             self.log(f"      Content rotation detected: horizontal text at bottom (avg y: {avg_y_position:.2f}) → suggest 180° rotation")
@@ -354,72 +800,94 @@ class PDFOrientationDetector:
             self.log(f"      Text direction analysis failed: {str(e)}")
             return page.rotation
 
-    def _determine_90_vs_270_rotation(self, page, text_dict) -> int:
+    def _determine_90_vs_270_rotation(self, stats: SpanStats) -> int:
         """
         Determine whether vertical text should be rotated 90° or 270°
 
-        This uses multiple strategies to distinguish between:
-        - 90° content rotation (text reads top-to-bottom)
-        - 270° content rotation (text reads bottom-to-top)
+        This combines several signals to distinguish between:
+        - 90° content rotation (text written bottom-to-top)
+        - 270° content rotation (text written top-to-bottom)
+
+        A decisive left/right vote of the vertical spans settles it outright.
+        Otherwise each strategy votes with its weight from ROTATION_VOTE_WEIGHTS,
+        and a tie goes to the bounding box analysis.
 
         Args:
-            page: PyMuPDF page object
-            text_dict: Text dictionary from page.get_text("dict")
+            stats: Span aggregates from _collect_span_stats
 
         Returns:
             int: 90 or 270
         """
         try:
-            page_rect = page.rect
+            majority_result = self._bbox_majority_rotation(stats)
+            if majority_result is not None:
+                return majority_result
 
-            # Strategy 1: Analyze text bounding box orientation
-            bbox_result = self._analyze_bbox_orientation(text_dict, page_rect)
-            if bbox_result is not None:
-                return bbox_result
+            votes = {90: 0, 270: 0}
 
-            # Strategy 2: If we have multiple text blocks, analyze flow direction
-            flow_result = self._analyze_text_flow_direction(text_dict, page_rect)
-            if flow_result is not None:
-                return flow_result
+            # Strategy 1: Analyze text bounding box orientation
+            bbox_result = self._analyze_bbox_orientation(stats)
+            # Strategy 2: Writing direction of the text lines
+            flow_result = self._analyze_text_flow_direction(stats)
+            # Strategy 3: Position-based analysis
+            position_result = self._fallback_position_based_rotation(stats)
+
+            for strategy, result in (('bbox', bbox_result), ('flow', flow_result),
+                                     ('position', position_result)):
+                if result is not None:
+                    votes[result] += ROTATION_VOTE_WEIGHTS[strategy]
+
+            if votes[90] == votes[270]:
+                rotation = bbox_result if bbox_result is not None else 90
+            else:
+                rotation = 90 if votes[90] > votes[270] else 270
 
-            # Strategy 3: Fallback to position-based analysis
-            return self._fallback_position_based_rotation(text_dict, page_rect)
+            self.log(f"      Rotation votes: 90°={votes[90]}, 270°={votes[270]} → {rotation}°")
+            return rotation
 
         except Exception as e:
             self.log(f"      90° vs 270° determination failed: {str(e)}")
             return 90  # Default fallback
 
-    def _analyze_bbox_orientation(self, text_dict, page_rect) -> Optional[int]:
+    def _bbox_majority_rotation(self, stats: SpanStats) -> Optional[int]:
+        """Return 90 or 270 when a decisive majority of vertical spans sits on one side, else None"""
+        upright_spans = np.flatnonzero(stats.upright)
+        if upright_spans.size < BBOX_VOTE_MIN_SPANS:
+            return None
+
+        left_votes = int(np.count_nonzero(stats.x_norm[upright_spans] < 0.5))
+        right_votes = upright_spans.size - left_votes
+        if max(left_votes, right_votes) / upright_spans.size <= BBOX_VOTE_MAJORITY:
+            return None
+
+        rotation = 90 if left_votes > right_votes else 270
+        self.log(f"      Bbox analysis: {left_votes} vertical spans on left, {right_votes} on right → suggesting {rotation}° rotation")
+        return rotation
+
+    def _analyze_bbox_orientation(self, stats: SpanStats) -> Optional[int]:
         """Analyze text bounding box orientation to determine rotation"""
         try:
-            for block in text_dict['blocks']:
-                if 'lines' in block:
-                    for line in block['lines']:
-                        if 'spans' in line:
-                            for span in line['spans']:
-                                if 'bbox' in span:
-                                    bbox = span['bbox']
-                                    width = bbox[2] - bbox[0]
-                                    height = bbox[3] - bbox[1]
-
-                                    # If text bounding box is taller than wide, it's likely vertical
-                                    # The position can help determine the rotation
-                                    if height > width:
-                                        x_center = (bbox[0] + bbox[2]) / 2
-                                        y_center = (bbox[1] + bbox[3]) / 2
-
-                                        x_normalized = x_center / page_rect.width
-                                        y_normalized = y_center / page_rect.height
-
-                                        self.log(f"      Bbox analysis: vertical text at x={x_normalized:.2f}, y={y_normalized:.2f}")
-
-                                        # For vertical text, use position with a bias towards 90°
-                                        if x_normalized < 0.5:
-                                            self.log(f"      Vertical text on left side → suggesting 90° rotation")
-                                            return 90
-                                        else:
-                                            self.log(f"      Vertical text on right side → suggesting 270° rotation")
-                                            return 270
+            # A decisive majority of vertical spans on one side settles it outright
+            majority_result = self._bbox_majority_rotation(stats)
+            if majority_result is not None:
+                return majority_result
+
+            # If a text bounding box is taller than wide, it's likely vertical
+            # The position of the first such span can help determine the rotation
+            upright_spans = np.flatnonzero(stats.upright)
+            if upright_spans.size:
+                x_normalized = stats.x_norm[upright_spans[0]]
+                y_normalized = stats.y_norm[upright_spans[0]]
+
+                self.log(f"      Bbox analysis: vertical text at x={x_normalized:.2f}, y={y_normalized:.2f}")
+
+                # For vertical text, use position with a bias towards 90°
+                if x_normalized < 0.5:
+                    self.log(f"      Vertical text on left side → suggesting 90° rotation")
+                    return 90
+                else:
+                    self.log(f"      Vertical text on right side → suggesting 270° rotation")
+                    return 270
 
             return None
 
@@ -427,83 +895,37 @@ class PDFOrientationDetector:
             self.log(f"      Bbox analysis failed: {str(e)}")
             return None
 
-    def _analyze_text_flow_direction(self, text_dict, page_rect) -> Optional[int]:
-        """Analyze text flow direction by looking at multiple text blocks"""
+    def _analyze_text_flow_direction(self, stats: SpanStats) -> Optional[int]:
+        """Analyze text flow direction from the writing direction of the vertical text lines"""
         try:
-            text_positions = []
-
-            # Collect all text positions
-            for block in text_dict['blocks']:
-                if 'lines' in block:
-                    for line in block['lines']:
-                        if 'spans' in line:
-                            for span in line['spans']:
-                                if 'bbox' in span:
-                                    bbox = span['bbox']
-                                    x_center = (bbox[0] + bbox[2]) / 2
-                                    y_center = (bbox[1] + bbox[3]) / 2
+            # Lines written mostly up or down the page carry a clear direction
+            upward = int(np.count_nonzero(stats.dir_y < -0.5))
+            downward = int(np.count_nonzero(stats.dir_y > 0.5))
 
-                                    x_normalized = x_center / page_rect.width
-                                    y_normalized = y_center / page_rect.height
+            self.log(f"      Text flow analysis: {upward} spans written upward, {downward} downward")
 
-                                    text_positions.append((x_normalized, y_normalized))
-
-            if len(text_positions) < 2:
+            if upward == downward:
                 return None
-
-            # Sort by Y position to understand reading order
-            sorted_by_y = sorted(text_positions, key=lambda pos: pos[1])
-
-            # Calculate Y progression
-            y_progressions = []
-            for i in range(1, len(sorted_by_y)):
-                prev_y = sorted_by_y[i-1][1]
-                curr_y = sorted_by_y[i][1]
-                y_progressions.append(curr_y - prev_y)
-
-            avg_progression = sum(y_progressions) / len(y_progressions)
-
-            self.log(f"      Text flow analysis: avg y progression={avg_progression:.3f}")
-
-            # Determine rotation based on flow direction
-            if avg_progression > 0:
-                self.log(f"      Text flows top-to-bottom → suggesting 90° rotation")
+            if upward > downward:
+                self.log(f"      Text flows bottom-to-top → suggesting 90° rotation")
                 return 90
             else:
-                self.log(f"      Text flows bottom-to-top → suggesting 270° rotation")
+                self.log(f"      Text flows top-to-bottom → suggesting 270° rotation")
                 return 270
 
         except Exception as e:
             self.log(f"      Text flow analysis failed: {str(e)}")
             return None
 
-    def _fallback_position_based_rotation(self, text_dict, page_rect) -> int:
-        """Fallback method using positioning when other analyses fail"""
+    def _fallback_position_based_rotation(self, stats: SpanStats) -> int:
+        """Suggest 90° or 270° from where the text sits on the page"""
         try:
-            text_positions = []
-
-            # Collect positions
-            for block in text_dict['blocks']:
-                if 'lines' in block:
-                    for line in block['lines']:
-                        if 'spans' in line:
-                            for span in line['spans']:
-                                if 'bbox' in span:
-                                    bbox = span['bbox']
-                                    x_center = (bbox[0] + bbox[2]) / 2
-                                    y_center = (bbox[1] + bbox[3]) / 2
-
-                                    x_normalized = x_center / page_rect.width
-                                    y_normalized = y_center / page_rect.height
-
-                                    text_positions.append((x_normalized, y_normalized))
-
-            if not text_positions:
+            if not stats.x_norm.size:
                 return 90
 
             # Calculate averages
-            avg_x = sum(pos[0] for pos in text_positions) / len(text_positions)
-            avg_y = sum(pos[1] for pos in text_positions) / len(text_positions)
+            avg_x = stats.x_norm.mean()
+            avg_y = stats.y_norm.mean()
 
             self.log(f"      Fallback positioning analysis: avg x={avg_x:.2f}, avg y={avg_y:.2f}")
 
@@ -534,12 +956,14 @@ class PDFOrientationDetector:
             return 90
 
     
-    def _determine_orientation_conservative(self, text_data: list, page_rect, current_rotation: int) -> int:
+    def _determine_orientation_conservative(self, widths: np.ndarray, heights: np.ndarray,
+                                            page_rect, current_rotation: int) -> int:
         """
         Improved orientation determination - correct obvious rotation issues more aggressively
 
         Args:
-            text_data: List of text block data
+            widths: Widths of the text blocks
+            heights: Heights of the text blocks
             page_rect: Page rectangle dimensions
             current_rotation: Current rotation setting
 
@@ -550,18 +974,10 @@ class PDFOrientationDetector:
             page_width = page_rect.width
             page_height = page_rect.height
 
-            # Count text directions
-            horizontal_text = 0
-            vertical_text = 0
+            # Count text directions - a block wider than tall is likely horizontal
+            horizontal_text = int(_count_horizontal_boxes(widths, heights))
 
-            for block in text_data:
-                # If text block is wider than tall, it's likely horizontal
-                if block['width'] > block['height']:
-                    horizontal_text += 1
-                else:
-                    vertical_text += 1
-
-            total_blocks = len(text_data)
+            total_blocks = widths.size
             if total_blocks == 0:
                 return current_rotation
 
@@ -603,7 +1019,7 @@ class PDFOrientationDetector:
             self.log(f"      Conservative orientation determination failed: {str(e)}")
             return current_rotation
 
-    def _determine_orientation_from_text_layout(self, text_data: list, page_rect) -> int:
+    def _determine_orientation_from_text_layout(self, widths: np.ndarray, heights: np.ndarray, page_rect) -> int:
         """
         Legacy orientation determination (less conservative)
         """
@@ -612,19 +1028,12 @@ class PDFOrientationDetector:
             page_height = page_rect.height
 
             # Calculate text distribution metrics
-            total_text_width = sum(block['width'] for block in text_data)
-            total_text_height = sum(block['height'] for block in text_data)
-
-            # Calculate average text line direction
-            horizontal_text = 0
-            vertical_text = 0
+            total_text_width = widths.sum()
+            total_text_height = heights.sum()
 
-            for block in text_data:
-                # If text block is wider than tall, it's likely horizontal
-                if block['width'] > block['height']:
-                    horizontal_text += 1
-                else:
-                    vertical_text += 1
+            # Calculate average text line direction - wider than tall is likely horizontal
+            horizontal_text = int(_count_horizontal_boxes(widths, heights))
+            vertical_text = widths.size - horizontal_text
 
             # Determine if document should be portrait or landscape
             # Most documents should be portrait-oriented
@@ -636,7 +1045,7 @@ class PDFOrientationDetector:
                 return 90
 
             # Heuristic: if text spans suggest landscape document
-            max_text_width = max(block['width'] for block in text_data)
+            max_text_width = widths.max()
             if max_text_width > page_width * 0.8:  # Text spans most of width
                 if page_height > page_width:  # But page is portrait
                     return 90  # Rotate to landscape
@@ -648,42 +1057,42 @@ class PDFOrientationDetector:
             self.log(f"      Orientation determination failed: {str(e)}")
             return 0
 
-    def _apply_pymupdf_corrections(self, input_pdf_path: str, output_pdf_path: str, corrections: list) -> bool:
+    def _save_corrected_pdf(self, doc, output_pdf_path: str):
         """
-        Apply rotation corrections using PyMuPDF
+        Write a document whose page rotations have been corrected
+
+        Only the pages' /Rotate entries changed, so unless config.OPTIMIZE_ON_SAVE
+        asks for a full rewrite, the source file is updated incrementally when it
+        is also the destination, and otherwise written out with its streams left
+        exactly as they were (no garbage collection, cleaning or re-deflating).
 
         Args:
-            input_pdf_path: Path to input PDF
+            doc: Open PyMuPDF document
             output_pdf_path: Path for output PDF
-            corrections: List of (page_num, rotation) tuples
-
-        Returns:
-            bool: True if successful
         """
-        try:
-            doc = fitz.open(input_pdf_path)
-
-            for page_num, rotation in corrections:
-                page = doc[page_num]
-                page.set_rotation(rotation)
-                self.log(f"   Page {page_num + 1}: set rotation to {rotation}°")
-
+        if config.OPTIMIZE_ON_SAVE:
             doc.save(output_pdf_path, garbage=4, deflate=True, clean=True)
-            doc.close()
-
-            self.log(f"✅ PyMuPDF corrections applied successfully")
-            return True
+        elif (doc.name and os.path.abspath(doc.name) == os.path.abspath(output_pdf_path)
+              and doc.can_save_incrementally()):
+            doc.save(doc.name, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+        else:
+            doc.save(output_pdf_path)
 
-        except Exception as e:
-            self.log(f"   PyMuPDF correction failed: {str(e)}")
-            return False
+    def _restore_rotations(self, doc, rotations: list):
+        """Put back page rotations after a failed correction so later strategies see the original document"""
+        try:
+            for page, rotation in zip(doc, rotations):
+                if page.rotation != rotation:
+                    page.set_rotation(rotation)
+        except Exception:
+            pass
 
-    def _try_ocr_detection(self, input_pdf_path: str, output_pdf_path: str) -> bool:
+    def _try_ocr_detection(self, doc, output_pdf_path: str) -> bool:
         """
         Try to detect orientation using OCR analysis (conservative approach)
 
         Args:
-            input_pdf_path: Path to input PDF
+            doc: Open PyMuPDF document
             output_pdf_path: Path for output PDF
 
         Returns:
@@ -691,11 +1100,8 @@ class PDFOrientationDetector:
         """
         try:
             # Only use OCR as a last resort, and be very conservative
-            doc = fitz.open(input_pdf_path)
-
             # Check if there's already a rotation set
             has_rotation = any(page.rotation != 0 for page in doc)
-            doc.close()
 
             if not has_rotation:
                 # If no rotation is set, assume it's correct
@@ -705,131 +1111,107 @@ class PDFOrientationDetector:
             # Only proceed with OCR if there's a rotation that might be wrong
             self.log(f"   Rotation metadata found, using conservative OCR analysis")
 
-            # Analyze first page only for speed
-            doc = fitz.open(input_pdf_path)
-            page = doc[0]
+            # Sample the first, middle and last pages - a blank cover or Bates-only
+            # first page alone often gives OSD too little text to go on
+            page_count = len(doc)
+            sample_pages = sorted({0, page_count // 2, page_count - 1})
 
-            # Render page at lower resolution for faster processing
-            pix = page.get_pixmap(matrix=fitz.Matrix(1.0, 1.0))
+            # Render in grayscale at a modest resolution for faster processing
+            # (PyMuPDF is not thread-safe, so all rendering happens here first)
+            pixmaps = []
+            for page_num in sample_pages:
+                page = doc[page_num]
+                zoom = min(OSD_RENDER_DPI / 72, OSD_MAX_IMAGE_EDGE / max(page.rect.width, page.rect.height))
+                pixmaps.append(page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False))
+
+            # Each orientation and script detection (OSD) pass reports how far its page
+            # must turn clockwise to read upright, and how sure it is; the Tesseract
+            # subprocesses run side by side
+            with ThreadPoolExecutor(max_workers=len(pixmaps)) as executor:
+                futures = [executor.submit(self._run_osd, pix) for pix in pixmaps]
+
+            # Vote for the absolute rotation each page asks for, weighted by confidence;
+            # only pages sure enough on their own to justify a rotation get a vote
+            votes = {}
+            change_requested = set()
+            for page_num, future in zip(sample_pages, futures):
+                try:
+                    osd_rotation, osd_confidence = future.result()
+                except Exception as e:
+                    self.log(f"   OSD failed for page {page_num + 1}: {str(e)}")
+                    continue
+
+                self.log(f"   OSD page {page_num + 1}: rotate {osd_rotation}° (orientation confidence {osd_confidence:.2f})")
+                if osd_confidence <= OSD_MIN_CONFIDENCE:
+                    continue
+                # Page rotation is clockwise too, so the correction adds to what is already set
+                target = (doc[page_num].rotation + osd_rotation) % 360
+                votes[target] = votes.get(target, 0.0) + osd_confidence
+                if osd_rotation != 0:
+                    change_requested.add(target)
+
+            if not votes:
+                self.log(f"   OCR analysis: no sampled page is confident enough (>{OSD_MIN_CONFIDENCE}) to correct")
+                return False
 
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+            target_rotation = max(votes, key=votes.get)
+            current_rotation = doc[0].rotation
+            if target_rotation in change_requested:
+                self.log(f"   OSD correction: {current_rotation}° → {target_rotation}° (vote {votes[target_rotation]:.2f})")
+                return self._apply_rotation_correction(doc, output_pdf_path, target_rotation)
 
-            # Test current orientation (0°) first
-            current_confidence = 0
-            try:
-                current_text = pytesseract.image_to_string(img)
-                current_confidence = self._calculate_text_confidence(current_text)
-                self.log(f"   Current orientation (0°): confidence {current_confidence:.2f}")
-            except Exception as e:
-                self.log(f"   OCR failed for current orientation: {str(e)}")
-
-            # Test other orientations if current confidence is moderate or low
-            if current_confidence < 0.7:  # Moderate confidence threshold
-                orientation_scores = {0: current_confidence}
-
-                # Test other orientations
-                for rotation in [90, 180, 270]:
-                    try:
-                        rotated_img = img.rotate(rotation, expand=True)
-                        text = pytesseract.image_to_string(rotated_img)
-                        confidence_score = self._calculate_text_confidence(text)
-                        orientation_scores[rotation] = confidence_score
-                        self.log(f"   Orientation {rotation}°: confidence {confidence_score:.2f}")
-                    except Exception as e:
-                        self.log(f"      OCR failed for {rotation}° rotation: {str(e)}")
-                        continue
-
-                # Find the best orientation
-                best_rotation = max(orientation_scores, key=orientation_scores.get)
-                best_confidence = orientation_scores[best_rotation]
-
-                # Apply correction if we have reasonable confidence, but prefer 0° rotation for consistency
-                confidence_threshold = 0.3  # Lower threshold for OCR-based correction
-
-                # Always prefer 0° rotation if it has reasonable confidence
-                if orientation_scores.get(0, 0) > confidence_threshold:
-                    # 0° rotation has reasonable confidence - use it
-                    if orientation_scores[0] > current_confidence * 1.1:  # Only need slight improvement
-                        self.log(f"   Conservative OCR correction: 0° rotation (preferred orientation)")
-                        doc.close()
-                        return self._apply_rotation_correction(input_pdf_path, output_pdf_path, 0)
-                    else:
-                        self.log(f"   No OCR correction: 0° rotation confidence similar to current")
-                elif best_confidence > confidence_threshold and best_rotation != 0:
-                    # Only use non-zero rotation if 0° confidence is very low
-                    if best_confidence > current_confidence * 1.5:  # Require significant improvement
-                        self.log(f"   Conservative OCR correction: {best_rotation}° (0° confidence too low)")
-                        doc.close()
-                        return self._apply_rotation_correction(input_pdf_path, output_pdf_path, best_rotation)
-                    else:
-                        self.log(f"   No OCR correction: insufficient confidence for non-zero rotation")
-
-            doc.close()
-            self.log(f"   OCR analysis: no correction needed (current confidence: {current_confidence:.2f})")
+            self.log(f"   OCR analysis: no correction needed (current {current_rotation}° reads upright or OSD unsure)")
             return False
 
         except Exception as e:
             self.log(f"   OCR detection failed: {str(e)}")
             return False
 
-    def _calculate_text_confidence(self, text: str) -> float:
+    def _run_osd(self, pix) -> Tuple[int, float]:
         """
-        Calculate confidence score for extracted text
+        Run Tesseract OSD on a rendered grayscale page, reusing cached results
 
         Args:
-            text: Extracted text from OCR
+            pix: Grayscale PyMuPDF pixmap of the page
 
         Returns:
-            float: Confidence score (0.0 to 1.0)
+            Tuple[int, float]: (clockwise rotation needed, orientation confidence)
         """
-        try:
-            if not text or len(text.strip()) == 0:
-                return 0.0
-
-            # Calculate various confidence metrics
-            confidence = 0.0
-
-            # 1. Text length (more text = higher confidence)
-            text_length = len(text.strip())
-            confidence += min(text_length / 1000, 0.3)  # Max 0.3 for length
-
-            # 2. Word count
-            words = text.split()
-            word_count = len(words)
-            confidence += min(word_count / 200, 0.3)  # Max 0.3 for word count
-
-            # 3. Character distribution (ratio of alphanumeric to total)
-            alnum_chars = sum(c.isalnum() or c.isspace() for c in text)
-            if len(text) > 0:
-                char_ratio = alnum_chars / len(text)
-                confidence += char_ratio * 0.2  # Max 0.2 for character quality
-
-            # 4. Line structure (presence of line breaks suggests structure)
-            line_count = text.count('\n') + 1
-            if line_count > 1:
-                confidence += min(line_count / 50, 0.2)  # Max 0.2 for line structure
-
-            return min(confidence, 1.0)
-
-        except Exception:
-            return 0.0
-
-    def _apply_rotation_correction(self, input_pdf_path: str, output_pdf_path: str, rotation: int) -> bool:
+        samples = pix.samples
+        key = (pix.width, pix.height, hashlib.md5(samples).digest())
+        cache = PDFOrientationDetector._osd_cache
+        with PDFOrientationDetector._osd_cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+
+        # Wrap the grayscale samples in a PIL Image without a second copy
+        img = Image.frombuffer("L", (pix.width, pix.height), samples, "raw", "L", pix.stride, 1)
+        img.format = OSD_IMAGE_FORMAT
+        osd = pytesseract.image_to_osd(img, output_type=pytesseract.Output.DICT)
+        result = (int(osd.get('rotate', 0)), float(osd.get('orientation_conf', 0.0)))
+
+        with PDFOrientationDetector._osd_cache_lock:
+            cache[key] = result
+            if len(cache) > OSD_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+        return result
+
+    def _apply_rotation_correction(self, doc, output_pdf_path: str, rotation: int) -> bool:
         """
         Apply rotation correction to PDF
 
         Args:
-            input_pdf_path: Path to input PDF
+            doc: Open PyMuPDF document
             output_pdf_path: Path for output PDF
             rotation: Rotation angle to apply
 
         Returns:
             bool: True if successful
         """
+        original_rotations = [page.rotation for page in doc]
         try:
-            doc = fitz.open(input_pdf_path)
-
             for page_num in range(len(doc)):
                 page = doc[page_num]
                 current_rotation = page.rotation
@@ -838,114 +1220,86 @@ class PDFOrientationDetector:
                 if page_num < 3:  # Log first 3 pages
                     self.log(f"   Page {page_num + 1}: rotation {current_rotation}° → {rotation}°")
 
-            doc.save(output_pdf_path, garbage=4, deflate=True, clean=True)
-            doc.close()
+            self._save_corrected_pdf(doc, output_pdf_path)
 
             self.log(f"✅ Applied {rotation}° rotation correction")
             return True
 
         except Exception as e:
             self.log(f"   Rotation correction failed: {str(e)}")
+            self._restore_rotations(doc, original_rotations)
             return False
 
-    def _try_aggressive_correction(self, input_pdf_path: str, output_pdf_path: str) -> bool:
+    def _try_aggressive_correction(self, doc, output_pdf_path: str) -> bool:
         """
         Aggressive rotation correction for obvious rotation issues
         This method corrects clearly wrong rotations without needing text analysis
 
         Args:
-            input_pdf_path: Path to input PDF
+            doc: Open PyMuPDF document
             output_pdf_path: Path for output PDF
 
         Returns:
             bool: True if correction was applied, False otherwise
         """
+        original_rotations = [page.rotation for page in doc]
         try:
-            doc = fitz.open(input_pdf_path)
             if len(doc) == 0:
-                doc.close()
                 return False
 
-            corrections_needed = []
+            # Measure every page once, then apply the rules to all pages at a time
+            geometry = np.array([(page.rotation, page.rect.width, page.rect.height) for page in doc],
+                                dtype=float)
+            rotations, page_widths, page_heights = geometry.T
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                current_rotation = page.rotation
-                page_rect = page.rect
-                page_width = page_rect.width
-                page_height = page_rect.height
+            # Rule 1: 180° rotation is almost always wrong for normal documents
+            upside_down = rotations == 180
 
-                # Aggressive correction rules for obvious issues
-                needs_correction = False
-                suggested_rotation = current_rotation
+            # Rule 2: 90° or 270° rotations should generally be corrected to 0° for consistency,
+            # provided the page gets a readable aspect ratio (long side over short side) from it
+            quarter_turned = (rotations == 90) | (rotations == 270)
+            corrected_aspect_ratios = np.maximum(page_widths, page_heights) / np.minimum(page_widths, page_heights)
+            readable_when_upright = quarter_turned & (corrected_aspect_ratios <= 2.0)
 
-                # Rule 1: 180° rotation is almost always wrong for normal documents
-                if current_rotation == 180:
+            # Rule 2b: Unrotated pages that are unusually wide landscapes might be portrait
+            # documents that were incorrectly saved as landscape
+            aspect_ratios = page_widths / page_heights
+            too_wide = (rotations == 0) & (aspect_ratios > 1.5)
+
+            corrections_applied = 0
+            for page_num in np.flatnonzero(upside_down | quarter_turned | too_wide).tolist():
+                current_rotation = int(rotations[page_num])
+                corrected_aspect_ratio = corrected_aspect_ratios[page_num]
+
+                if upside_down[page_num]:
                     suggested_rotation = 0
-                    needs_correction = True
                     self.log(f"   Page {page_num + 1}: Aggressive correction - 180° → 0° (180° is rarely correct)")
+                elif readable_when_upright[page_num]:
+                    # This would create a readable document - correct to 0°
+                    suggested_rotation = 0
+                    self.log(f"   Page {page_num + 1}: Enhanced correction - {current_rotation}° → 0° (creates readable aspect ratio {corrected_aspect_ratio:.2f})")
+                elif quarter_turned[page_num]:
+                    # Unusual aspect ratio - for very wide or very tall documents, keep current rotation
+                    self.log(f"   Page {page_num + 1}: Keeping {current_rotation}° rotation (unusual aspect ratio {corrected_aspect_ratio:.2f})")
+                    continue
+                else:
+                    suggested_rotation = 90  # Try rotating to portrait
+                    self.log(f"   Page {page_num + 1}: Aggressive correction - 0° → 90° (unusually wide landscape {aspect_ratios[page_num]:.2f})")
 
-                # Rule 2: 90° or 270° rotations should generally be corrected to 0° for consistency
-                elif current_rotation in [90, 270]:
-                    # Calculate what the aspect ratio would be after correction to 0°
-                    if page_width < page_height:
-                        # Currently portrait-oriented, would become landscape after correction
-                        corrected_aspect_ratio = page_height / page_width
-                    else:
-                        # Currently landscape-oriented, would become portrait after correction
-                        corrected_aspect_ratio = page_width / page_height
-
-                    # ENHANCED: More aggressive correction for native PDFs with obvious rotation issues
-                    # Most documents should be in portrait orientation (0°) for reading
-                    # If we have a reasonable aspect ratio after correction, apply it
-                    if 1.0 <= corrected_aspect_ratio <= 2.0:
-                        # This would create a readable document - correct to 0°
-                        suggested_rotation = 0
-                        needs_correction = True
-                        self.log(f"   Page {page_num + 1}: Enhanced correction - {current_rotation}° → 0° (creates readable aspect ratio {corrected_aspect_ratio:.2f})")
-                    else:
-                        # Unusual aspect ratio - check if it's a special case
-                        # For very wide or very tall documents, keep current rotation
-                        needs_correction = False
-                        self.log(f"   Page {page_num + 1}: Keeping {current_rotation}° rotation (unusual aspect ratio {corrected_aspect_ratio:.2f})")
-
-                # Rule 2b: Check if current page dimensions suggest it should be landscape but isn't rotated
-                elif current_rotation == 0 and page_width > page_height:
-                    # Page is landscape-oriented but has 0° rotation - check if it should be portrait
-                    aspect_ratio = page_width / page_height
-                    if aspect_ratio > 1.5:  # Unusually wide landscape
-                        # This might be a portrait document that was incorrectly saved as landscape
-                        suggested_rotation = 90  # Try rotating to portrait
-                        needs_correction = True
-                        self.log(f"   Page {page_num + 1}: Aggressive correction - 0° → 90° (unusually wide landscape {aspect_ratio:.2f})")
-
-                # Rule 3: Check if the rotation creates an extremely unusual aspect ratio
-                elif current_rotation in [90, 270]:
-                    # After 90° rotation, check if aspect ratio is reasonable
-                    rotated_width = page_height  # What would be width after rotation
-                    rotated_height = page_width  # What would be height after rotation
-
-                    # If rotated aspect ratio is extreme (e.g., > 3:1), it's probably wrong
-                    aspect_ratio = max(rotated_width / rotated_height, rotated_height / rotated_width)
-                    if aspect_ratio > 3.0:
-                        suggested_rotation = 0
-                        needs_correction = True
-                        self.log(f"   Page {page_num + 1}: Aggressive correction - {current_rotation}° → 0° (extreme aspect ratio {aspect_ratio:.1f}:1)")
-
-                if needs_correction and suggested_rotation != current_rotation:
-                    corrections_needed.append((page_num, suggested_rotation))
-
-            doc.close()
+                doc[page_num].set_rotation(suggested_rotation)
+                corrections_applied += 1
 
-            # Apply corrections if needed
-            if corrections_needed:
-                self.log(f"📝 Applying {len(corrections_needed)} aggressive rotation corrections")
-                return self._apply_pymupdf_corrections(input_pdf_path, output_pdf_path, corrections_needed)
+            if corrections_applied:
+                self.log(f"📝 Applying {corrections_applied} aggressive rotation corrections")
+                self._save_corrected_pdf(doc, output_pdf_path)
+                self.log(f"✅ PyMuPDF corrections applied successfully")
+                return True
 
             return False
 
         except Exception as e:
             self.log(f"   Aggressive correction failed: {str(e)}")
+            self._restore_rotations(doc, original_rotations)
             return False
 
     def get_orientation_info(self, pdf_path: str) -> Dict[str, Any]:
@@ -0,0 +1,196 @@
+"""
+Tests for the PDF converter
+"""
+
+import ast
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+PDF_CONVERTER_SOURCE = Path(__file__).parent.parent / "src" / "pdf_converter.py"
+TEST_PROCESS_ID = os.getpid()
+
+
+@pytest.fixture
+def converter(temp_dir, mock_log_callback):
+    """PDF converter that is shut down (closing its databases) before temp_dir is removed"""
+    from pdf_converter import PDFConverter
+    pdf_converter = PDFConverter(log_callback=mock_log_callback)
+    yield pdf_converter
+    pdf_converter.shutdown()
+
+
+def _pdf_converter_method_names():
+    """Names of every method defined in the PDFConverter class body, in order"""
+    tree = ast.parse(PDF_CONVERTER_SOURCE.read_text(encoding="utf-8"))
+    converter = next(node for node in tree.body
+                     if isinstance(node, ast.ClassDef) and node.name == "PDFConverter")
+    return [node.name for node in converter.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+
+
+def _failing_ocr_worker(page_index):
+    """OCR worker whose task fails with an OSError subclass, as Tesseract and PIL raise"""
+    raise FileNotFoundError(f"page {page_index}")
+
+
+def _dying_ocr_worker(page_index):
+    """OCR worker whose process exits mid-task when run in a pool"""
+    if os.getpid() != TEST_PROCESS_ID:
+        os._exit(1)
+    return page_index
+
+
+class TestConverterDefinitions:
+    """Guard against a later method definition silently shadowing an earlier one"""
+
+    @pytest.mark.parametrize("method_name", [
+        "_convert_word_to_pdf_enhanced",
+        "_convert_text_to_pdf_enhanced",
+    ])
+    def test_enhanced_converter_defined_once(self, method_name):
+        assert _pdf_converter_method_names().count(method_name) == 1
+
+
+class TestLineMapping:
+    """Line mapping metadata stored per output folder"""
+
+    def test_round_trip_through_database(self, converter, temp_dir):
+        from pdf_converter import LINEMAP_DB_NAME
+
+        pdf_path = temp_dir / "doc.pdf"
+        positions = [72.5, 86.25, 100.0, 113.75]
+        converter._store_line_mapping(pdf_path, positions, len(positions))
+
+        mapping = converter.load_line_mapping(pdf_path)
+
+        assert (temp_dir / LINEMAP_DB_NAME).exists()
+        assert not pdf_path.with_suffix('.linemap.json').exists()
+        assert mapping['pdf_file'] == "doc.pdf"
+        assert mapping['total_lines'] == 4
+        assert mapping['line_positions'] == pytest.approx(positions)
+        assert mapping['conversion_type'] == 'enhanced'
+
+    def test_rows_are_kept_per_pdf(self, converter, temp_dir):
+        converter._store_line_mapping(temp_dir / "a.pdf", [10.0], 1)
+        converter._store_line_mapping(temp_dir / "b.pdf", [20.0, 30.0], 2)
+
+        assert converter.load_line_mapping(temp_dir / "a.pdf")['line_positions'] == [10.0]
+        assert converter.load_line_mapping(temp_dir / "b.pdf")['total_lines'] == 2
+
+    def test_loads_legacy_json_sidecar(self, converter, temp_dir):
+        pdf_path = temp_dir / "old.pdf"
+        legacy = {
+            'pdf_file': "old.pdf",
+            'total_lines': 2,
+            'line_positions': [50.0, 64.0],
+            'conversion_type': 'enhanced',
+            'line_height': 12,
+            'font_size': 10,
+            'created_timestamp': 1700000000.0,
+        }
+        pdf_path.with_suffix('.linemap.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+        assert converter.load_line_mapping(pdf_path) == legacy
+
+    def test_missing_mapping_returns_none(self, converter, temp_dir):
+        assert converter.load_line_mapping(temp_dir / "none.pdf") is None
+
+
+class TestTiffConversion:
+    """TIFF to PDF conversion"""
+
+    def test_multi_page_tiff_keeps_every_frame(self, converter, temp_dir):
+        fitz = pytest.importorskip("fitz")
+        Image = pytest.importorskip("PIL.Image")
+
+        tiff_path = temp_dir / "scan.tif"
+        frames = [Image.new("RGB", (200, 300), color) for color in ("white", "gray", "black")]
+        frames[0].save(tiff_path, save_all=True, append_images=frames[1:])
+        pdf_path = temp_dir / "scan.pdf"
+
+        success, _, _ = converter.convert_to_pdf(str(tiff_path), str(pdf_path), perform_ocr=False)
+
+        assert success
+
+        with fitz.open(pdf_path) as doc:
+            assert len(doc) == 3
+
+
+class TestExistingPdf:
+    """Text and mixed PDFs are passed through unchanged"""
+
+    @pytest.mark.parametrize("doc_subtype", ["pdf_text", "pdf_mixed"])
+    def test_copy_is_byte_identical(self, converter, temp_dir, doc_subtype):
+        fitz = pytest.importorskip("fitz")
+
+        input_pdf = temp_dir / "produced.pdf"
+        with fitz.open() as doc:
+            doc.new_page().insert_text((72, 72), "Exhibit text")
+            doc.set_page_labels([{'startpage': 0, 'prefix': 'A-', 'style': 'D'}])
+            doc.embfile_add("note.txt", b"attachment")
+            doc.save(input_pdf)
+        output_pdf = temp_dir / "out" / "produced.pdf"
+        output_pdf.parent.mkdir()
+
+        assert converter._handle_existing_pdf(str(input_pdf), str(output_pdf), doc_subtype=doc_subtype)
+
+        assert output_pdf.read_bytes() == input_pdf.read_bytes()
+
+
+class TestOcrZoom:
+    """Per-page rasterization zoom for OCR"""
+
+    @staticmethod
+    def _page_with_image(doc, image_size, page_size=(612, 792)):
+        fitz = pytest.importorskip("fitz")
+        page = doc.new_page(width=page_size[0], height=page_size[1])
+        if image_size:
+            pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, *image_size), False)
+            pix.clear_with(255)
+            page.insert_image(page.rect, pixmap=pix)
+        return page
+
+    @pytest.mark.parametrize("image_size, expected", [
+        (None, 2.0),                 # text page: full OCR zoom
+        ((2550, 3300), 2.0),         # 300 dpi scan: capped at OCR_MAX_ZOOM
+        ((1020, 1320), 1020 / 612),  # 120 dpi scan: its own resolution
+        ((306, 396), 1.0),           # 36 dpi scan: never below OCR_MIN_ZOOM
+    ])
+    def test_zoom_follows_scan_resolution(self, image_size, expected):
+        fitz = pytest.importorskip("fitz")
+        from pdf_converter import _ocr_zoom
+
+        with fitz.open() as doc:
+            page = self._page_with_image(doc, image_size)
+            assert _ocr_zoom(page) == pytest.approx(expected)
+
+    def test_oversized_page_stays_within_render_limit(self):
+        fitz = pytest.importorskip("fitz")
+        from pdf_converter import _ocr_zoom, OCR_MAX_RENDER_PX
+
+        with fitz.open() as doc:
+            page = self._page_with_image(doc, None, page_size=(2000, 3000))
+            assert 3000 * _ocr_zoom(page) == pytest.approx(OCR_MAX_RENDER_PX)
+
+
+class TestOcrTaskMapping:
+    """Pool fallback in _map_ocr_tasks"""
+
+    @pytest.fixture
+    def pooled_converter(self, converter, monkeypatch):
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        return converter
+
+    def test_worker_error_propagates_without_sequential_rerun(self, pooled_converter, mock_log_callback):
+        with pytest.raises(FileNotFoundError):
+            pooled_converter._map_ocr_tasks(_failing_ocr_worker, 2, [0, 1])
+
+        assert not any("unavailable" in call.args[0] for call in mock_log_callback.call_args_list)
+
+    def test_broken_pool_falls_back_to_sequential(self, pooled_converter, mock_log_callback):
+        assert pooled_converter._map_ocr_tasks(_dying_ocr_worker, 2, [0, 1]) == [0, 1]
+
+        assert any("Parallel OCR unavailable" in call.args[0] for call in mock_log_callback.call_args_list)
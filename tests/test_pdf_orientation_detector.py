@@ -0,0 +1,99 @@
+"""
+Tests for PDF orientation detection
+"""
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from pdf_orientation_detector import PDFOrientationDetector, _collect_span_stats
+
+PAGE_RECT = fitz.Rect(0, 0, 612, 792)
+
+
+def _vertical_span(x):
+    """Bounding box of a tall, narrow span centered at x (points)"""
+    return (x - 7, 100, x + 7, 400)
+
+
+def _span_stats(bboxes):
+    """SpanStats for a page whose text dictionary holds one span per bbox, in order"""
+    text_dict = {'blocks': [{'lines': [{'dir': (0.0, -1.0), 'spans': [{'bbox': bbox}]}
+                                       for bbox in bboxes]}]}
+    return _collect_span_stats(text_dict, PAGE_RECT)
+
+
+@pytest.fixture
+def detector(mock_log_callback):
+    return PDFOrientationDetector(log_callback=mock_log_callback)
+
+
+class TestBboxOrientation:
+    """Left/right vote of the vertical spans in _analyze_bbox_orientation"""
+
+    def test_left_majority_overrides_first_span(self, detector):
+        # The first vertical span is on the right, but 5 of 6 sit on the left
+        stats = _span_stats([_vertical_span(550)] + [_vertical_span(60)] * 5)
+        assert detector._analyze_bbox_orientation(stats) == 90
+
+    def test_right_majority_overrides_first_span(self, detector):
+        stats = _span_stats([_vertical_span(60)] + [_vertical_span(550)] * 5)
+        assert detector._analyze_bbox_orientation(stats) == 270
+
+    @pytest.mark.parametrize("first_x, expected", [(60, 90), (550, 270)])
+    def test_even_split_falls_back_to_first_span(self, detector, first_x, expected):
+        other_x = 550 if first_x == 60 else 60
+        stats = _span_stats([_vertical_span(first_x)] * 3 + [_vertical_span(other_x)] * 3)
+        assert detector._analyze_bbox_orientation(stats) == expected
+
+    def test_too_few_spans_for_a_vote_use_first_span(self, detector):
+        # Below BBOX_VOTE_MIN_SPANS no side vote is taken - the first span decides
+        stats = _span_stats([_vertical_span(550), _vertical_span(60)])
+        assert detector._analyze_bbox_orientation(stats) == 270
+
+    def test_no_vertical_spans(self, detector):
+        stats = _span_stats([(72, 100, 500, 112)] * 6)
+        assert detector._analyze_bbox_orientation(stats) is None
+
+
+def _write_pdf(path, sideways_pages, page_count):
+    """Write a PDF of upright text pages, with sideways (upward) text on the given pages"""
+    with fitz.open() as doc:
+        for page_num in range(page_count):
+            page = doc.new_page(width=PAGE_RECT.width, height=PAGE_RECT.height)
+            for line in range(12):
+                if page_num in sideways_pages:
+                    page.insert_text((60 + line * 15, 700), f"Sideways exhibit line {line}",
+                                     fontsize=10, rotate=90)
+                else:
+                    page.insert_text((72, 80 + line * 15), f"Upright body line {line}", fontsize=10)
+        doc.save(path)
+
+
+class TestPageSampling:
+    """Leading-page sampling in _try_pymupdf_detection"""
+
+    @pytest.fixture
+    def sequential_detector(self, detector):
+        detector.parallel_page_analysis = False
+        return detector
+
+    def test_sideways_page_after_upright_sample_is_corrected(self, sequential_detector, temp_dir):
+        input_pdf = temp_dir / "mixed.pdf"
+        output_pdf = temp_dir / "mixed_out.pdf"
+        _write_pdf(input_pdf, sideways_pages={6}, page_count=10)
+
+        assert sequential_detector.detect_and_correct_orientation(str(input_pdf), str(output_pdf))
+
+        with fitz.open(output_pdf) as doc:
+            assert [page.rotation for page in doc] == [0] * 6 + [90] + [0] * 3
+
+    def test_agreeing_sample_corrects_every_page(self, sequential_detector, temp_dir):
+        input_pdf = temp_dir / "sideways.pdf"
+        output_pdf = temp_dir / "sideways_out.pdf"
+        _write_pdf(input_pdf, sideways_pages=set(range(6)), page_count=6)
+
+        assert sequential_detector.detect_and_correct_orientation(str(input_pdf), str(output_pdf))
+
+        with fitz.open(output_pdf) as doc:
+            assert [page.rotation for page in doc] == [90] * 6